@@ -1,6 +1,8 @@
 import logging
+from collections import OrderedDict
 from contextlib import suppress
 
+from natug import settings
 from natug.runner.managers.manager import Manager
 from natug.structures.helices import DoubleHelices
 
@@ -21,6 +23,69 @@ class DoubleHelicesManager(Manager):
         recompute: Recompute and update the manager's current double helices.
     """
 
+    def __init__(self, runner: "Runner", current: object = None):
+        super().__init__(runner, current)
+        # The outputs of the most recent computations keyed by their inputs, so that
+        # recomputing with domains and a nucleic acid profile that were recently used
+        # (e.g. after an undo) can reuse the old helix data. Least recently used first.
+        self._computed: OrderedDict[tuple, tuple] = OrderedDict()
+
+    def _compute_key(self) -> tuple:
+        """
+        Obtain a hashable key of everything that the helix data depends on.
+
+        Returns:
+            A tuple of the nucleic acid profile's parameters and each domain's
+            parameters.
+        """
+        profile = self.runner.managers.nucleic_acid_profile.current
+        return (
+            (profile.D, profile.H, profile.g, profile.T, profile.B, profile.Z_mate),
+            tuple(
+                (
+                    domain.theta_m_multiple,
+                    domain.left_helix_joint,
+                    domain.right_helix_joint,
+                    domain.up_helix_count,
+                    domain.down_helix_count,
+                )
+                for domain in self.runner.managers.domains.current.domains()
+            ),
+        )
+
+    @property
+    def _last_key(self) -> tuple:
+        """The key of the most recently used computation."""
+        return next(reversed(self._computed))
+
+    def _reusable_count(self, key: tuple) -> int:
+        """
+        Obtain how many leading double helices of the most recent computation can be
+        reused for a computation with the given key.
+
+        Each double helix only depends on the nucleic acid profile, its own domain,
+        and the double helix before it. So if the profile is unchanged, the double
+        helices up to the first domain that changed can be reused as they are.
+
+        Args:
+            key: The key of the computation that is about to be done.
+
+        Returns:
+            The number of leading double helices that can be reused.
+        """
+        if not self._computed:
+            return 0
+        last_profile, last_domains = self._last_key
+        profile, domains = key
+        if profile != last_profile:
+            return 0
+        reused = 0
+        for last_domain, domain in zip(last_domains, domains):
+            if last_domain != domain:
+                break
+            reused += 1
+        return reused
+
     def restore(self):
         """
         Setup the double helices manager from a blank program state.
@@ -58,9 +123,43 @@ class DoubleHelicesManager(Manager):
             domains=self.runner.managers.domains.current,
             nucleic_acid_profile=self.runner.managers.nucleic_acid_profile.current,
         )
-        # Compute the points based off of the newly computed double helices.
-        # (.from_domains()
-        self.current.compute()
-        # Log that the double helices have been computed.
-        logger.info("Recomputed double helices.")
+        # Compute the points based off of the newly computed double helices. If
+        # nothing that the data depends on has changed since a recent computation,
+        # reuse the data from then instead. Otherwise, reuse the data of the leading
+        # domains that are unchanged since the last computation.
+        key = self._compute_key()
+        if key in self._computed:
+            self._computed.move_to_end(key)
+            reused = len(self.current)
+        else:
+            reused = self._reusable_count(key)
+        if reused:
+            for double_helix, helices_data in zip(
+                self.current, self._computed[self._last_key][:reused]
+            ):
+                for helix, (x_coords, z_coords, angles) in zip(
+                    double_helix.helices, helices_data
+                ):
+                    helix.data.x_coords = x_coords
+                    helix.data.z_coords = z_coords
+                    helix.data.angles = angles
+        if reused == len(self.current):
+            logger.info("Reused previously computed double helices.")
+        else:
+            # Each double helix is aligned to the previous one, so everything from
+            # the first changed domain onwards must be computed again.
+            self.current.compute(start=reused)
+            self._computed[key] = tuple(
+                tuple(
+                    (helix.data.x_coords, helix.data.z_coords, helix.data.angles)
+                    for helix in double_helix.helices
+                )
+                for double_helix in self.current
+            )
+            if len(self._computed) > settings.cached_double_helices:
+                self._computed.popitem(last=False)
+            # Log that the double helices have been computed.
+            logger.info(
+                "Recomputed double helices from domain #%s onwards.", reused + 1
+            )
         return self.current
@@ -19,10 +19,32 @@ class ToolbarManager(Manager):
     def __init__(self, runner: "Runner"):
         self.runner = runner
         self.actions = None
+        self._mode_buttons = ()
 
     def setup(self):
         self.actions: QButtonGroup = self.runner.window.toolbar.actions
         self.actions.buttons[JUNCTER].setChecked(True)
+        # The buttons that set_enabled() toggles, resolved once.
+        self._mode_buttons = tuple(
+            self.actions.buttons[id_] for id_ in (INFORMER, NICKER, LINKER, JUNCTER)
+        )
+
+    def set_enabled(
+        self, informer: bool, nicker: bool, linker: bool, juncter: bool
+    ) -> None:
+        """
+        Enable or disable the toolbar's interaction modes.
+
+        Args:
+            informer: Whether the informer mode is enabled.
+            nicker: Whether the nicker mode is enabled.
+            linker: Whether the linker mode is enabled.
+            juncter: Whether the juncter mode is enabled.
+        """
+        for button, enabled in zip(
+            self._mode_buttons, (informer, nicker, linker, juncter)
+        ):
+            button.setEnabled(enabled)
 
     @property
     def current(self) -> str:
@@ -134,6 +134,13 @@ class Runner:
         self.managers.snapshots.setup()
         logger.debug("Managers loaded.")
 
+        # Warm the icon cache, so that icons don't have to be loaded one by one as
+        # the window's widgets are created.
+        from natug.ui.resources import preload_icons
+
+        preload_icons()
+        logger.debug("Icons preloaded.")
+
         # Create a Window instance but don't set it up yet
         self.window = ui.Window(self)
         logger.debug("Main window created.")
@@ -7,6 +7,9 @@ extension = "natug"
 snapshot_path = "saves/snapshots"
 default_snapshot_max_capacity = 16
 
+# Number of recent double helix computations to keep for reuse.
+cached_double_helices = 8
+
 # Threshold to determine whether a tube is closed.
 closed_threshold = 0.01
 cross_screen_line_length = 0.3
@@ -1,7 +1,9 @@
 from copy import copy
-from typing import Tuple
+from typing import NamedTuple, Tuple
 from uuid import uuid1
 
+import numpy as np
+
 from natug.constants.directions import *
 from natug.structures.points.point import x_coord_from_angle
 from natug.structures.profiles import NucleicAcidProfile
@@ -9,80 +11,48 @@ from natug.structures.strands import Strand
 from natug.utils import inverse
 
 
-class GenerationCount:
+def theta_i_from_multiples(
+    theta_m_multiple: int | np.ndarray,
+    theta_s_multiple: int | np.ndarray,
+    nucleic_acid_profile: NucleicAcidProfile,
+) -> float | np.ndarray:
     """
-    A class for storing the number of NEMids to generate for a domain.
-
-    Attributes:
-        bottom_count: The number of NEMids to generate for the bottom strand.
-        body_count: The number of NEMids to generate for the body strand.
-        top_count: The number of NEMids to generate for the top strand.
-
-    Method:
-        direction: The direction that this is the generation count for.
-    """
-
-    def __init__(self, count: Tuple[int, int, int], direction=None):
-        """
-        Initialize a GenerationCount object.
+    Compute the interior angle of a domain from its theta_m and theta_s multiples.
 
-        Args:
-            count: The number of NEMids to generate for the bottom, body, and top
-                strands.
-        """
-        self.bottom_count = count[0]
-        self.body_count = count[1]
-        self.top_count = count[2]
-
-        self.direction = direction
+    This is a utility function, and doesn't apply to a specific instance of Domain.
+    It is the single source of truth for theta_i, and is used both for a single
+    domain and for arrays of the multiples of many domains at once.
 
-    def __len__(self) -> int:
-        """
-        Get the number of NEMids to generate for the bottom, body, and top strands.
+    Args:
+        theta_m_multiple: The theta_m_multiple of the domain, or an array of them.
+        theta_s_multiple: The theta_s_multiple of the domain, or an array of them.
+        nucleic_acid_profile: The nucleic acid profile of the domain(s).
 
-        Returns:
-            The number of NEMids to generate for the bottom, body, and top strands.
-        """
-        return 3
+    Returns:
+        The interior angle, or an array of interior angles if arrays were passed.
+    """
+    return (
+        theta_m_multiple * nucleic_acid_profile.theta_c
+        + theta_s_multiple * nucleic_acid_profile.theta_s
+    )
 
-    def __getitem__(self, index: int) -> int:
-        """
-        Get the number of NEMids to generate for the bottom, body, and top strands.
 
-        Args:
-            index: The index of the number of NEMids to generate for the bottom, body,
-                and top strands.
+class GenerationCount(NamedTuple):
+    """
+    A class for storing the number of NEMids to generate for a domain.
 
-        Returns:
-            The number of NEMids to generate for the bottom, body, and top strands.
-        """
-        if index == 0:
-            return self.bottom_count
-        elif index == 1:
-            return self.body_count
-        elif index == 2:
-            return self.top_count
-        else:
-            raise IndexError("Index out of range.")
+    This is a named tuple, so indexing into it, iterating over it, and summing it
+    are all handled by the tuple machinery instead of Python level methods.
 
-    def __setitem__(self, index: int, value: int):
-        """
-        Set the number of NEMids to generate for the bottom, body, and top strands.
+    Attributes:
+        bottom_count: The number of NEMids to generate for the bottom strand.
+        body_count: The number of NEMids to generate for the body strand.
+        top_count: The number of NEMids to generate for the top strand.
+    """
 
-        Args:
-            index: The index of the number of NEMids to generate for the bottom, body,
-                and top strands.
-            value: The number of NEMids to generate for the bottom, body, and top
-                strands.
-        """
-        if index == 0:
-            self.bottom_count = value
-        elif index == 1:
-            self.body_count = value
-        elif index == 2:
-            self.top_count = value
-        else:
-            raise IndexError("Index out of range.")
+    bottom_count: int
+    body_count: int
+    top_count: int
 
     def __repr__(self):
         return f"GenCount({self.bottom_count}, {self.body_count}, {self.top_count})"
@@ -108,7 +78,7 @@ class GenerationCount:
                 "bottom_count-body_count-top_count"
         """
         count = string.split("-")
-        return cls((int(count[0]), int(count[1]), int(count[2])))
+        return cls(int(count[0]), int(count[1]), int(count[2]))
 
 
 class Domain:
@@ -153,6 +123,11 @@ class Domain:
             were normally.
     """
 
+    _repr_template = (
+        "Domain(m={}, left_joint={}, right_joint={}, up_count={}, down_count={}, "
+        "index={})"
+    )
+
     def __init__(
         self,
         nucleic_acid_profile: NucleicAcidProfile,
@@ -203,18 +178,18 @@ class Domain:
         self.theta_m_multiple: int = theta_m_multiple
 
         # the helical joints
-        self.left_helix_joint = left_helix_joint
-        self.right_helix_joint = right_helix_joint
+        self._left_helix_joint = left_helix_joint
+        self._right_helix_joint = right_helix_joint
         assert self.left_helix_joint in [0, 1]
         assert self.right_helix_joint in [0, 1]
 
+        # the switch multiple only depends on the helical joints, so it is computed
+        # whenever they are set rather than every time it is read
+        self._update_theta_s_multiple()
+
         # the number of NEMids to generate for the left and right helices
-        self.up_helix_count = GenerationCount(
-            up_helix_count, direction=lambda: self.left_helix_joint
-        )
-        self.down_helix_count = GenerationCount(
-            down_helix_count, direction=lambda: self.right_helix_joint
-        )
+        self.up_helix_count = GenerationCount(*up_helix_count)
+        self.down_helix_count = GenerationCount(*down_helix_count)
 
         # set the index of the domain
         self.index = index
@@ -274,8 +249,9 @@ class Domain:
             The angle of each NEMid in the domain.
         """
         angle = start
+        theta_b = self.nucleic_acid_profile.theta_b
         while True:
-            angle += self.nucleic_acid_profile.theta_b
+            angle += theta_b
             yield angle
 
     def x_coords(self):
@@ -296,8 +272,9 @@ class Domain:
             The z coords of each NEMid in the domain.
         """
         z_coord = start
+        Z_b = self.nucleic_acid_profile.Z_b
         while True:
-            z_coord += self.nucleic_acid_profile.Z_b
+            z_coord += Z_b
             yield z_coord
 
     @property
@@ -313,10 +290,10 @@ class Domain:
         Returns:
             The left strand of the domain or None if the domain doesn't have a strands.
         """
-        if self.parent is None or self.parent.strands:
+        if self.parent is None or self.parent.strands is None:
             return None
         else:
-            return Strand(self.parent.strands.items()[self.index][RIGHT])
+            return Strand(self.parent.strands.items()[self.index][LEFT])
 
     @property
     def right_strand(self) -> Strand | None:
@@ -331,33 +308,50 @@ class Domain:
         Returns:
             The right strand of the domain or None if the domain doesn't have a strands.
         """
-        if self.parent is None:
+        if self.parent is None or self.parent.strands is None:
             return None
         else:
             return Strand(self.parent.strands.items()[self.index][RIGHT])
 
     @property
-    def theta_s_multiple(self) -> int:
+    def left_helix_joint(self) -> int:
+        """The left helix joint's upwardness or downwardness."""
+        return self._left_helix_joint
+
+    @left_helix_joint.setter
+    def left_helix_joint(self, value: int) -> None:
+        self._left_helix_joint = value
+        self._update_theta_s_multiple()
+
+    @property
+    def right_helix_joint(self) -> int:
+        """The right helix joint's upwardness or downwardness."""
+        return self._right_helix_joint
+
+    @right_helix_joint.setter
+    def right_helix_joint(self, value: int) -> None:
+        self._right_helix_joint = value
+        self._update_theta_s_multiple()
+
+    def _update_theta_s_multiple(self) -> None:
         """
-        Obtain the theta switch multiple. This is either -1, 0, or 1.
+        Recompute the theta switch multiple. This is either -1, 0, or 1.
         Based on the left and right helical joints, this outputs:
         (-1) for up to down; (0) for both up/down; (1) for down to up
 
-        This is very computationally inexpensive, so it is a property.
-        (self.theta_s_multiple)
-        """
-        try:
-            return {
-                (UP, DOWN): -1,
-                (UP, UP): 0,
-                (DOWN, DOWN): 0,
-                (DOWN, UP): 1,
-            }[(self.left_helix_joint, self.right_helix_joint)]
-        except KeyError:
+        Since UP is 0 and DOWN is 1, this is just the left joint minus the right joint.
+        The result is stored in self.theta_s_multiple, and is recomputed whenever
+        either of the helical joints is set.
+        """
+        if (
+            self._left_helix_joint not in (UP, DOWN)
+            or self._right_helix_joint not in (UP, DOWN)
+        ):
             raise ValueError(
                 "Invalid helical joint integer",
-                (self.left_helix_joint, self.right_helix_joint),
+                (self._left_helix_joint, self._right_helix_joint),
             )
+        self.theta_s_multiple = self._left_helix_joint - self._right_helix_joint
 
     @property
     def theta_s(self) -> float:
@@ -385,7 +379,9 @@ class Domain:
 
         This is equivalent to self.theta_m + self.theta_s.
         """
-        return self.theta_m + self.theta_s
+        return theta_i_from_multiples(
+            self.theta_m_multiple, self.theta_s_multiple, self.nucleic_acid_profile
+        )
 
     @property
     def theta_e(self) -> float:
@@ -398,13 +394,11 @@ class Domain:
 
     def __repr__(self):
         """Return a string representation of the Domain object."""
-        return (
-            f"Domain("
-            f"m={self.theta_m_multiple}, "
-            f"left_joint={self.left_helix_joint}, "
-            f"right_joint={self.right_helix_joint}, "
-            f"up_count={self.up_helix_count}, "
-            f"down_count={self.down_helix_count}, "
-            f"index={self.index}"
-            f")"
+        return self._repr_template.format(
+            self.theta_m_multiple,
+            self._left_helix_joint,
+            self._right_helix_joint,
+            self.up_helix_count,
+            self.down_helix_count,
+            self.index,
         )
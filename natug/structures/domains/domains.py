@@ -1,8 +1,8 @@
+import csv
 import logging
 import math
-from contextlib import suppress
 from copy import copy
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,6 +11,7 @@ from xlsxwriter import Workbook
 from natug import settings
 from natug.constants.directions import DOWN, UP
 from natug.structures.domains import Domain
+from natug.structures.domains.domain import theta_i_from_multiples
 from natug.structures.domains.subunit import Subunit
 from natug.structures.profiles import NucleicAcidProfile
 from natug.utils import timer
@@ -40,6 +41,7 @@ class Domains:
     Methods:
         strands: Returns a Strands object containing all the strands in the domains.
         top_view: Obtain a set of coords for the centers of all the double helices.
+        arrays: Obtain the angle multiples of all the domains as arrays.
         domains: Returns a list of all domains.
         destroy_symmetry: Destroy the symmetry of the domains.
         invert: Invert two domains deeper into the nanotube.
@@ -47,6 +49,7 @@ class Domains:
         closed: Whether the tube is closed or not.
         update: Update the domains object in place.
         to_df: Export the domains to a dataframe.
+        to_csv: Export the domains to a csv file.
         from_df: Import the domains from a dataframe.
         write_worksheet: Write the domains to a tab in an Excel document.
     """
@@ -170,6 +173,48 @@ class Domains:
         # Create a pandas dataframe with the columns above
         return pd.DataFrame(data)
 
+    def to_csv(self, filepath: str, include_uuid: bool = True) -> None:
+        """
+        Write the current domains to a csv file.
+
+        The file has the same columns as the dataframe created by to_df(), so it can
+        be read back in with from_df(). The rows are written directly with the csv
+        module, since building a dataframe just to serialize it is wasted work.
+
+        Args:
+            filepath: The path to the file to write to.
+            include_uuid: Whether to include a column of the domains' uuids.
+        """
+        header = [
+            "data:m",
+            "data:left_helix_joints",
+            "data:right_helix_joints",
+            "data:up_helix_counts",
+            "data:down_helix_counts",
+            "data:symmetry",
+            "data:antiparallel",
+        ]
+        if include_uuid:
+            header.append("uuid")
+
+        with open(filepath, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            for index, domain in enumerate(self.subunit.domains):
+                row = [
+                    domain.theta_m_multiple,
+                    "UP" if domain.left_helix_joint == UP else "DOWN",
+                    "UP" if domain.right_helix_joint == UP else "DOWN",
+                    "&".join(map(str, domain.up_helix_count)),
+                    "&".join(map(str, domain.down_helix_count)),
+                    # symmetry and antiparallelity only take up the first row
+                    self.symmetry if index == 0 else None,
+                    self.antiparallel if index == 0 else None,
+                ]
+                if include_uuid:
+                    row.append(domain.uuid)
+                writer.writerow(row)
+
     @classmethod
     def dummy(cls, nucleic_acid_profile: NucleicAcidProfile):
         """An arbitrary minimal Domains object."""
@@ -293,6 +338,32 @@ class Domains:
         sheet.write(1, 10, self.symmetry)
         sheet.write(1, 11, self.antiparallel)
 
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain the angle multiples of all the domains as arrays.
+
+        This gathers the per-domain multiples into one array each, so that
+        computations over all the domains can be done with NumPy at once instead of
+        domain by domain.
+
+        Returns:
+            A tuple of two arrays of shape (n,):
+                theta_m_multiples: The theta_m_multiple of each domain.
+                theta_s_multiples: The theta_s_multiple of each domain.
+        """
+        domains = self.domains()
+        theta_m_multiples = np.fromiter(
+            (domain.theta_m_multiple for domain in domains),
+            dtype=np.int32,
+            count=len(domains),
+        )
+        theta_s_multiples = np.fromiter(
+            (domain.theta_s_multiple for domain in domains),
+            dtype=np.int8,
+            count=len(domains),
+        )
+        return theta_m_multiples, theta_s_multiples
+
     @timer(logger=logger, task_name="Domains top view computation")
     def top_view(self) -> np.ndarray:
         """
@@ -305,27 +376,30 @@ class Domains:
                 coordinate is prepended to the array to represent the origin entry
                 direction.
         """
-        domains = self.domains()
-        coords = np.zeros((self.count + 2, 2))
+        theta_m_multiples, theta_s_multiples = self.arrays()
+        coords = np.zeros((len(theta_m_multiples) + 2, 2))
         diameter = self.nucleic_acid_profile.D
 
+        theta_i = theta_i_from_multiples(
+            theta_m_multiples, theta_s_multiples, self.nucleic_acid_profile
+        )
+
         coords[0] = (
-            -diameter * math.cos(math.radians(180 + domains[0].theta_i)),
-            -diameter * math.sin(math.radians(180 + domains[0].theta_i)),
+            -diameter * math.cos(math.radians(180 + theta_i[0])),
+            -diameter * math.sin(math.radians(180 + theta_i[0])),
         )
         # coords[1] = (0, 0) (this is the default)
         coords[2] = (diameter, 0)
-        absolute_angle = 180 - domains[1].theta_i
-
-        for index in range(3, self.count + 2):
-            coords[index] = (
-                coords[index - 1][0]
-                + diameter * math.cos(math.radians(absolute_angle)),
-                coords[index - 1][1]
-                + diameter * math.sin(math.radians(absolute_angle)),
-            )
-            with suppress(IndexError):
-                absolute_angle += 180 - domains[index - 1].theta_i
+
+        # Every subsequent domain is one diameter away from the previous one, in the
+        # direction of the absolute angle. The absolute angle turns by 180 - theta_i
+        # of each domain along the way, so all the angles, steps, and coords can be
+        # computed for every domain at once with cumulative sums.
+        absolute_angles = np.radians(np.cumsum(180 - theta_i[1:]))
+        steps = diameter * np.column_stack(
+            (np.cos(absolute_angles), np.sin(absolute_angles))
+        )
+        coords[3:] = coords[2] + np.cumsum(steps, axis=0)
 
         return coords
 
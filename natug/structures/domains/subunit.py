@@ -27,6 +27,7 @@ class Subunit:
         append()
         remove()
         inverted()
+        resized()
     """
 
     def __init__(
@@ -141,33 +142,49 @@ class Subunit:
                 The number of domains changes based off the difference between this
                 and the previous count.
         """
+        self.domains = self.resized(new)
+
+    def resized(self, count: int) -> List["Domain"]:
+        """
+        Obtain the domains that the subunit would have with a different count.
+
+        The subunit itself is left untouched.
+
+        * When the count is greater new domains are added with alternating helix
+            joints but with the same settings. Looks at the right helix joint of the last
+            domain to begin the oscillation of parallel-ness.
+        * When the count is smaller domains are trimmed off of the end.
+
+        Args:
+            count: The number of domains to obtain.
+
+        Returns:
+            A new list of domains of length count. Existing domains are not copied.
+        """
         # we couldn't import domains before because it was partially initialized but
         # we can now (and we will need it if the count increases to make new domains)
         from natug.structures.domains import Domain
 
-        # if the subunit count has decreased then trim off extra domains
-        if new < self.count:
-            self.domains = self.domains[:new]
-        # if the subunit count has increased then add placeholder domains based on
-        # last domain in domain list
-        else:
-            i = 0
-            while self.count < new:
-                previous_domain = self.domains[-1]
-                # the new template domains will be of altering strand directions with
-                # assumed strand switches of 0
-                self.domains.append(
-                    Domain(
-                        self.nucleic_acid_profile,
-                        theta_m_multiple=previous_domain.theta_m_multiple,
-                        left_helix_joint=inverse(previous_domain.right_helix_joint),
-                        right_helix_joint=inverse(previous_domain.right_helix_joint),
-                        up_helix_count=previous_domain.up_helix_count,
-                        down_helix_count=previous_domain.down_helix_count,
-                        parent=self,
-                    )
+        # trim off extra domains, which leaves all the domains if there aren't extra
+        domains = self.domains[:count]
+        # if the count has increased then add placeholder domains based on last domain
+        # in domain list
+        while len(domains) < count:
+            previous_domain = domains[-1]
+            # the new template domains will be of altering strand directions with
+            # assumed strand switches of 0
+            domains.append(
+                Domain(
+                    self.nucleic_acid_profile,
+                    theta_m_multiple=previous_domain.theta_m_multiple,
+                    left_helix_joint=inverse(previous_domain.right_helix_joint),
+                    right_helix_joint=inverse(previous_domain.right_helix_joint),
+                    up_helix_count=previous_domain.up_helix_count,
+                    down_helix_count=previous_domain.down_helix_count,
+                    parent=self,
                 )
-                i += 1
+            )
+        return domains
 
     def __getitem__(self, item):
         """
@@ -12,19 +12,43 @@ from natug.utils import Timer
 logger = logging.getLogger(__name__)
 
 
-vectorized_x_coords_from_angles = np.vectorize(x_coord_from_angle)
-
-def x_coords_from_angles(angles: np.ndarray, domain: "Domain") -> np.ndarray:
+def overlapping_indices(
+    x_coords1: np.ndarray,
+    z_coords1: np.ndarray,
+    x_coords2: np.ndarray,
+    z_coords2: np.ndarray,
+    width: int,
+) -> np.ndarray:
     """
-    Compute the x coords from the angles.
+    Find all the pairs of points from two sets of points that overlap.
+
+    This is a vectorized version of Point.overlaps() which checks every point of the
+    first set against every point of the second set at once. Two points overlap if
+    they share the same position, or if one lies on the very left side of the
+    plot (x=0) and the other lies on the very right side of the plot (x=width) at
+    the same z coord.
 
     Args:
-        angles: The angles to use for the computation.
+        x_coords1: The x coords of the first set of points.
+        z_coords1: The z coords of the first set of points.
+        x_coords2: The x coords of the second set of points.
+        z_coords2: The z coords of the second set of points.
+        width: The width of the strands container (the number of domains).
 
     Returns:
-        The x coords.
+        An array of shape (n, 2) containing the index of each overlapping point in
+        the first set alongside the index of the point it overlaps in the second set.
+        The pairs are in the same order that a nested loop over the first set and
+        then the second set would find them in.
     """
-    return vectorized_x_coords_from_angles(angles, domain)
+    x_coords1, z_coords1 = x_coords1[:, np.newaxis], z_coords1[:, np.newaxis]
+    x_coords2, z_coords2 = x_coords2[np.newaxis, :], z_coords2[np.newaxis, :]
+    overlapping = (z_coords1 == z_coords2) & (
+        (x_coords1 == x_coords2)
+        | ((x_coords1 == 0) & (x_coords2 == width))
+        | ((x_coords2 == 0) & (x_coords1 == width))
+    )
+    return np.argwhere(overlapping)
 
 
 class DoubleHelices:
@@ -150,6 +174,7 @@ class DoubleHelices:
 
         strands = Strands(nucleic_acid_profile=self.nucleic_acid_profile, strands=())
 
+        width = self.domains.count
         double_helices = []
         for double_helix in self:
             up_helix = double_helix.up_helix.strand(
@@ -161,6 +186,20 @@ class DoubleHelices:
             double_helices.append((up_helix, down_helix))
 
         with Timer("Junctability assignment", logger=logger):
+            # Only NEMids can be junctable. We know that every other item of each
+            # helix, starting at the second item, is a NEMid based on how we're
+            # constructing the helices. Their coords are sliced straight out of the
+            # helices' data arrays (rounded the same way Helix.points() rounds them)
+            # rather than being read off of every NEMid object.
+            NEMids = {}
+            for double_helix in double_helices:
+                for strand in double_helix:
+                    NEMids[id(strand)] = (
+                        strand.items[1::2],
+                        np.round(strand.helix.data.x_coords[1::2], 5),
+                        np.round(strand.helix.data.z_coords[1::2], 5),
+                    )
+
             # Assign junctability to each NEMid that superposes a NEMid in a helix of the
             # subsequent double helix.
             for index, double_helix in enumerate(double_helices):
@@ -169,36 +208,24 @@ class DoubleHelices:
                 else:
                     next_double_helix = double_helices[index + 1]
 
-                # Iterate through all the points in the current double helix, and check
-                # if they superpose with any points in the next double helix. Note that
-                # each double helix contains two helices, so we must iterate through all
-                # the points in both helices.
+                # Check all the NEMids in the current double helix against all the
+                # NEMids in the next double helix. Note that each double helix contains
+                # two helices, so we must compare all four pairs of helices.
                 for helix1 in double_helix:
+                    points1, x_coords1, z_coords1 = NEMids[id(helix1)]
                     for helix2 in next_double_helix:
-                        for point1 in helix1.items[1::2]:
-                            for point2 in helix2.items[1::2]:
-                                # We know that all overlaps are going to be on the
-                                # integer line, so we only need to check points that
-                                # are on the integer line. True, the following
-                                # implementation may sometimes check points that happen
-                                # to have the same decimal value by chance, but we will
-                                # then run the full on overlaps() method afterwards
-                                # anyway. Comparing the decimal value once is much
-                                # faster than checking to see if the %1=0 two times (
-                                # ~2x as fast).
-                                if point1.x_coord % 1 == point2.x_coord % 1:
-                                    if point1.overlaps(
-                                        point2, width=self.domains.count
-                                    ):
-                                        point1.junctable = True
-                                        point1.juncmate = point2
-                                        point2.junctable = True
-                                        point2.juncmate = point1
-
-                                        # fmt: off
-                                        point1.helix.data.right_joint_points.append(point1)
-                                        point2.helix.data.left_joint_points.append(point2)
-                                        # fmt: on
+                        points2, x_coords2, z_coords2 = NEMids[id(helix2)]
+                        for index1, index2 in overlapping_indices(
+                            x_coords1, z_coords1, x_coords2, z_coords2, width
+                        ):
+                            point1, point2 = points1[index1], points2[index2]
+                            point1.junctable = True
+                            point1.juncmate = point2
+                            point2.junctable = True
+                            point2.juncmate = point1
+
+                            point1.helix.data.right_joint_points.append(point1)
+                            point2.helix.data.left_joint_points.append(point2)
 
         strands = [helix for double_helix in double_helices for helix in double_helix]
         strands = Strands(
@@ -208,15 +235,43 @@ class DoubleHelices:
         strands.style()
         return strands
 
-    def compute(self) -> None:
+    def compute(self, start: int = 0) -> None:
         """
         Compute the point data for each helix.
 
         This computes the x coord, z coord, and angle arrays for each helix. The data
         is stored in the helices respective x coord, z coord, and angle arrays.
+
+        Args:
+            start: The index of the first double helix to compute. Each double helix
+                is aligned to the one before it, so the double helices before this
+                index must already hold their data. Defaults to 0.
         """
         logger.debug("Computing helix data")
-        for index, double_helix in enumerate(self):
+        # The profile's derived values are properties that are recomputed on every
+        # access, so they are read once here instead of many times per domain.
+        Z_b = self.nucleic_acid_profile.Z_b
+        theta_b = self.nucleic_acid_profile.theta_b
+        B = self.nucleic_acid_profile.B
+        g = self.nucleic_acid_profile.g
+        Z_mate = self.nucleic_acid_profile.Z_mate
+        # Interval at which the aligned z coords are shifted down (see below)
+        decrease_interval = abs(Z_b * B)
+
+        def fill_helix_data(helix, initial_z_coord, initial_angle):
+            """Write a helix's z coords and angles into its preallocated arrays."""
+            size = 2 * sum(helix.counts) - 1
+            if len(helix.data) != size:
+                helix.data.resize(size)
+            steps = np.arange(size)
+            # Nucleosides & NEMids are each half a step apart
+            np.multiply(steps, Z_b / 2, out=helix.data.z_coords)
+            helix.data.z_coords += initial_z_coord
+            np.multiply(steps, theta_b / 2, out=helix.data.angles)
+            helix.data.angles += initial_angle
+
+        for index in range(start, len(self)):
+            double_helix = self[index]
             logger.debug("Starting domain #%s", index + 1)
             # Create a reference to the previous double helix
             previous_double_helix = self[index - 1]
@@ -238,13 +293,11 @@ class DoubleHelices:
                 # nucleoside). This is because we only care about NEMids for the
                 # aligning process. Note that ALL helices will start and end with a
                 # nucleoside.
-                aligned_z_coord = previous_double_helix.right_helix.data.z_coords[1::2][
-                    argmax(
-                        previous_double_helix.right_helix.data.x_coords[
-                            1 : self.nucleic_acid_profile.B * 2 + 1 : 2
-                        ]
-                    )
-                ]
+                # The argmax is the index within the NEMids, so it is mapped back to an
+                # index within the whole helix to read the z coord directly.
+                previous_data = previous_double_helix.right_helix.data
+                rightmost_NEMid = argmax(previous_data.x_coords[1 : B * 2 + 1 : 2])
+                aligned_z_coord = previous_data.z_coords[2 * rightmost_NEMid + 1]
                 logger.debug("Aligned_z_coord = %s", aligned_z_coord)
 
                 # Shift down the initial z coord. We can shift it down in increments
@@ -252,9 +305,6 @@ class DoubleHelices:
                 # interval at which the z coord decreases). This will ensure that all
                 # the aligned z coords are below the x-axis. We will then shift them
                 # upwards later.
-                decrease_interval = abs(
-                    self.nucleic_acid_profile.Z_b * self.nucleic_acid_profile.B
-                )
                 aligned_z_coord = aligned_z_coord % decrease_interval
                 logger.debug("Lowered aligned_z_coord to %s", aligned_z_coord)
             aligned_angle = 0  # aligned angle is always 0 at left junctable Bill 3/1/23
@@ -266,18 +316,16 @@ class DoubleHelices:
             # Increment the starting z coord by the height between bases times the
             # number of shifts that we must apply to force the initial z coord to be
             # above the x-axis.
-            initial_z_coord = aligned_z_coord % self.nucleic_acid_profile.Z_b
+            initial_z_coord = aligned_z_coord % Z_b
             logger.debug(
                 "Initial_z_coord (near x-axis) = %s aligned_z_coord = %s",
                 initial_z_coord,
                 aligned_z_coord,
             )
-            shifts = round(
-                (initial_z_coord - aligned_z_coord) / self.nucleic_acid_profile.Z_b
-            )
+            shifts = round((initial_z_coord - aligned_z_coord) / Z_b)
             # Since we've shifted the z coord, we must also shift the angle accordingly.
             logger.debug("Shifts = %s", shifts)
-            initial_angle = shifts * self.nucleic_acid_profile.theta_b
+            initial_angle = shifts * theta_b
             logger.debug("Initial_angle (near x-axis) = %s", initial_angle)
             # Note that the x coordinates are generated based off of the angles,
             # so we don't need to even define an "initial_x_coord" variable.
@@ -291,15 +339,11 @@ class DoubleHelices:
             logger.debug("Increments = %s", increments)
             initial_z_coord = (
                 initial_z_coord
-                - (increments * self.nucleic_acid_profile.Z_b)
-                - (self.nucleic_acid_profile.Z_b / 2)  # Extra nucleoside on bottom
+                - (increments * Z_b)
+                - (Z_b / 2)  # Extra nucleoside on bottom
             )
             logger.debug("Last value of initial_z_coord = %s", initial_z_coord)
-            initial_angle = (
-                initial_angle
-                - (increments * self.nucleic_acid_profile.theta_b)
-                - (self.nucleic_acid_profile.theta_b / 2)
-            )
+            initial_angle = initial_angle - (increments * theta_b) - (theta_b / 2)
             logger.debug("Initial_angle left strand (final value) = %s", initial_angle)
             initial_angle = initial_angle % 360.0
             # This makes the initial angle in range [0°,360°)
@@ -307,50 +351,26 @@ class DoubleHelices:
                 "Initial_angle left strand (moduloed final value) = %s", initial_angle
             )
 
-            # Now we can determine the ending z coord and angle for the zeroed helix.
-            # It is the domain's body_count plus the domain's top_count number of
-            # increments up from the respective initial z coord and angle.
-            increments = (
-                -0.5
-                + double_helix.zeroed_helix.counts.bottom_count
-                + double_helix.zeroed_helix.counts.body_count
-                + double_helix.zeroed_helix.counts.top_count
-            )
-            final_z_coord = initial_z_coord + (
-                increments * self.nucleic_acid_profile.Z_b
-            )  # Extra nucleoside on top
-            final_angle = initial_angle + (
-                increments * self.nucleic_acid_profile.theta_b
-            )
-
             # Compute the z coord and angle data for the zeroed helix; we will
             # generate the angles based off of the x coords later. Recall that we're
             # generating for the zeroed helix first because the initial z coord is
             # defined to be the z coord of the right-most point of the previous
             # double helix's right joint helix, which makes this domain's left helix
-            # the zeroed helix.
-            padding = -self.nucleic_acid_profile.Z_b / 16
-            double_helix.zeroed_helix.data.z_coords = np.arange(
-                start=initial_z_coord,
-                stop=final_z_coord + padding,  # Make inclusive w/padding
-                step=self.nucleic_acid_profile.Z_b / 2,  # Nucleosides & NEMids
-            )
-            padding = -self.nucleic_acid_profile.theta_b / 16
-            double_helix.zeroed_helix.data.angles = np.arange(
-                start=initial_angle,
-                stop=final_angle + padding,  # Make inclusive w/padding
-                step=self.nucleic_acid_profile.theta_b / 2,  # Nucleosides & NEMids
-            )
-            # The angles are computed based off of the x coords using the predefined
-            # x_coord_from_angles function. The function lives above the
-            # DoubleHelices class in this file.
-            double_helix.zeroed_helix.data.x_coords = x_coords_from_angles(
+            # the zeroed helix. The data is written straight into the helix's
+            # preallocated arrays. The helix spans the domain's bottom_count plus
+            # body_count plus top_count NEMids, with a nucleoside between each pair
+            # of NEMids and on either end.
+            fill_helix_data(double_helix.zeroed_helix, initial_z_coord, initial_angle)
+            # The x coords are computed based off of the angles using the
+            # x_coord_from_angle function of the point module, which takes the whole
+            # array of angles at once.
+            double_helix.zeroed_helix.data.x_coords = x_coord_from_angle(
                 double_helix.zeroed_helix.data.angles, domain
             )
 
             # Repeat the same process that we used for the zeroed strand of computing
-            # the arange start and stop values based on domain's helices' generation
-            # counts.
+            # the initial values and filling in the data based on domain's helices'
+            # generation counts.
 
             # However, note that there is an offset this time for the z coords and
             # angles, which we must take into account.
@@ -365,49 +385,23 @@ class DoubleHelices:
             increments = double_helix.other_helix.counts.bottom_count
             initial_angle = (
                 aligned_angle  # The previously aligned angle of the left helix
-                + (
-                    shifts * self.nucleic_acid_profile.theta_b
-                )  # locates angle of NEMid nearest x-axis
-                + (
-                    -modifier * self.nucleic_acid_profile.g
-                )  # Helix switch to other helix
-                - (increments * self.nucleic_acid_profile.theta_b)
-                - (self.nucleic_acid_profile.theta_b / 2)  # Extra nucleoside on bottom
+                + (shifts * theta_b)  # locates angle of NEMid nearest x-axis
+                + (-modifier * g)  # Helix switch to other helix
+                - (increments * theta_b)
+                - (theta_b / 2)  # Extra nucleoside on bottom
             )
             initial_z_coord = (
                 aligned_z_coord  # The previously aligned z coord
-                + (
-                    shifts * self.nucleic_acid_profile.Z_b
-                )  # locates z of NEMid nearest x-axis
-                + (-modifier * self.nucleic_acid_profile.Z_mate)  # Helix switch
-                - (increments * self.nucleic_acid_profile.Z_b)
-                - (self.nucleic_acid_profile.Z_b / 2)  # Extra nucleoside on bottom
+                + (shifts * Z_b)  # locates z of NEMid nearest x-axis
+                + (-modifier * Z_mate)  # Helix switch
+                - (increments * Z_b)
+                - (Z_b / 2)  # Extra nucleoside on bottom
             )
 
-            # Same procedure as for the zeroed helix.
-            increments = (
-                -0.5
-                + double_helix.other_helix.counts.bottom_count
-                + double_helix.other_helix.counts.body_count
-                + double_helix.other_helix.counts.top_count
-            )
-            final_angle = initial_angle + increments * self.nucleic_acid_profile.theta_b
-            final_z_coord = initial_z_coord + increments * self.nucleic_acid_profile.Z_b
-
-            # Compute the z coord and angle data for the other helix.
-            padding = -self.nucleic_acid_profile.Z_b / 16
-            double_helix.other_helix.data.z_coords = np.arange(
-                start=initial_z_coord,
-                stop=final_z_coord + padding,  # Make inclusive w/padding
-                step=self.nucleic_acid_profile.Z_b / 2,  # Nucleosides & NEMids
-            )
-            padding = -self.nucleic_acid_profile.theta_b / 16
-            double_helix.other_helix.data.angles = np.arange(
-                start=initial_angle,
-                stop=final_angle + padding,  # Make inclusive w/padding
-                step=self.nucleic_acid_profile.theta_b / 2,  # Nucleosides & NEMids
-            )
-            double_helix.other_helix.data.x_coords = x_coords_from_angles(
+            # Compute the z coord and angle data for the other helix, in the same
+            # way as for the zeroed helix.
+            fill_helix_data(double_helix.other_helix, initial_z_coord, initial_angle)
+            double_helix.other_helix.data.x_coords = x_coord_from_angle(
                 double_helix.other_helix.data.angles, domain
             )
 
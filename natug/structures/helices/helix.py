@@ -1,4 +1,3 @@
-import itertools
 import logging
 from dataclasses import dataclass, field
 from typing import Iterable, Literal, Type
@@ -157,20 +156,19 @@ class Helix:
         """
         self.data.points = np.zeros(len(self.data.angles), dtype=object)
         domain = self.double_helix.domain if self.double_helix else None
-
-        for index, cls, angle, x_coord, z_coord in zip(
-            itertools.count(),
-            itertools.cycle(
-                (NEMid, Nucleoside) if begin == NEMid else (Nucleoside, NEMid)
-            ),
-            self.data.angles,
-            self.data.x_coords,
-            self.data.z_coords,
-        ):
-            point = cls(  # type: ignore
-                angle=angle,
-                x_coord=round(x_coord, 5),
-                z_coord=round(z_coord, 5),
+        types = (NEMid, Nucleoside) if begin == NEMid else (Nucleoside, NEMid)
+
+        # Round all the coords in one go, and convert them to lists of Python floats,
+        # which are much cheaper to iterate over than NumPy arrays.
+        angles = self.data.angles.tolist()
+        x_coords = np.round(self.data.x_coords, 5).tolist()
+        z_coords = np.round(self.data.z_coords, 5).tolist()
+
+        for index in range(len(angles)):
+            point = types[index % 2](  # type: ignore
+                angle=angles[index],
+                x_coord=x_coords[index],
+                z_coord=z_coords[index],
                 direction=self.direction,
                 domain=domain,
                 helix=self,
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from typing import Iterable, Tuple
 from uuid import uuid1
 
+import numpy as np
 import pandas as pd
 
 from natug import settings
@@ -12,26 +13,37 @@ from natug.utils import rgb_to_hex
 logger = logging.getLogger(__name__)
 
 
-def x_coord_from_angle(angle: float, domain: "Domain") -> float:
+def x_coord_from_angle(
+    angle: float | np.ndarray, domain: "Domain"
+) -> float | np.ndarray:
     """
     Compute a new x coord based on the angle and domain of this Point.
 
     This is a utility function, and doesn't apply to a specific instance of Point.
 
     Args:
-        angle: The angle of the point to compute an x coord for.
+        angle: The angle of the point to compute an x coord for. This may also be an
+            array of angles, in which case an array of x coords is returned.
         domain: The domain of the point having its x angle computed.
 
     Returns:
-        The x coord.
+        The x coord, or an array of x coords if an array of angles was passed.
     """
-    # modulo the angle between 0 and 360
-    angle %= 360
+    # theta_i is derived from a chain of domain and profile properties, so look it
+    # up once instead of once per use (domain.theta_e is 360 - domain.theta_i).
+    theta_i = domain.theta_i
+    theta_e = 360 - theta_i
 
-    if angle < domain.theta_e:
-        x_coord = angle / domain.theta_e
+    # modulo the angle between 0 and 360
+    if isinstance(angle, np.ndarray):
+        angle = np.mod(angle, 360)
+        x_coord = np.where(angle < theta_e, angle / theta_e, (360 - angle) / theta_i)
     else:
-        x_coord = (360 - angle) / domain.theta_i
+        angle %= 360
+        if angle < theta_e:
+            x_coord = angle / theta_e
+        else:
+            x_coord = (360 - angle) / theta_i
 
     # domain 0 lies between [0, 1] on the x axis
     # domain 1 lies between [1, 2] on the x axis
@@ -8,7 +8,7 @@ from openpyxl.worksheet.worksheet import Worksheet as pyxlWorksheet
 from xlsxwriter.utility import xl_col_to_name
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NucleicAcidProfile:
     """
     A container for all geometrical parameters for a nucleic acid.
@@ -26,6 +26,11 @@ class NucleicAcidProfile:
         notes: Notes about the nucleic acid profile.
         uuid: The uuid of the nucleic acid profile. This is automatically generated.
 
+    Notes:
+        Profiles are slotted so that their attributes, which are read very often
+        while computing helices, are accessed quickly. They are not frozen, since
+        update() mutates profiles in place.
+
     Methods:
         update: Update our nucleic_acid_profile in place.
         to_file: Write the nucleic acid nucleic_acid_profile to a file.
@@ -206,10 +211,36 @@ class NucleicAcidProfile:
 
         Checks all of our attributes against theirs.
         """
+        if self is other:
+            return True
         if not isinstance(other, NucleicAcidProfile):
             return False
 
-        return all(getattr(self, attr) == getattr(other, attr) for attr in asdict(self))
+        return self._key() == other._key()
+
+    def _key(self) -> tuple:
+        """
+        Obtain a tuple of all of our attributes.
+
+        Comparing two of these tuples is a single C-level comparison, which is much
+        cheaper than comparing the attributes one by one in Python.
+
+        Notes:
+            The key is rebuilt on every call instead of being cached, since profiles
+            are mutated in place by update().
+        """
+        return (
+            self.name,
+            self.D,
+            self.H,
+            self.g,
+            self.T,
+            self.B,
+            self.Z_c,
+            self.notes,
+            self.Z_mate,
+            self.uuid,
+        )
 
 
 def to_df(nucleic_acid_profiles: Iterable[NucleicAcidProfile]) -> pd.DataFrame:
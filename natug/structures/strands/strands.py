@@ -6,6 +6,7 @@ from functools import partial
 from typing import Generator, Iterable, List, Literal, Tuple
 from uuid import uuid1
 
+import numpy as np
 import pandas as pd
 from pandas import ExcelWriter
 from PyQt6.QtCore import QTimer
@@ -940,6 +941,45 @@ class Strands:
         if style:
             self.style()
 
+    def coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtain the coords of all the points in the strands container.
+
+        The coords are gathered in one pass over the container and returned as a
+        structure of arrays, so that reductions over them (min, max, etc.) can be
+        done with NumPy instead of re-walking every strand.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (x_coords, z_coords)
+        """
+        points = tuple(self.items(Point))
+        x_coords = np.fromiter(
+            (point.x_coord for point in points), dtype=float, count=len(points)
+        )
+        z_coords = np.fromiter(
+            (point.z_coord for point in points), dtype=float, count=len(points)
+        )
+        return x_coords, z_coords
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Obtain the bounds of the strands container.
+
+        Returns:
+            Tuple[float, float, float, float]: (x_min, x_max, y_min, y_max)
+
+        Notes:
+            This only walks the container once, so prefer it over calling x_min(),
+            x_max(), y_min(), and y_max() individually.
+        """
+        x_coords, z_coords = self.coords()
+        return (
+            float(x_coords.min()),
+            float(x_coords.max()),
+            float(z_coords.min()),
+            float(z_coords.max()),
+        )
+
     def y_min(self) -> float:
         """The minimum z coordinate of the strands container."""
         return min([strand.y_min() for strand in self.strands])
@@ -958,11 +998,13 @@ class Strands:
 
     def height(self):
         """Obtain the height of the strands container."""
-        return self.y_max() - self.y_min()
+        _, _, y_min, y_max = self.bounds()
+        return y_max - y_min
 
     def width(self):
         """Obtain the width of the strands container."""
-        return self.x_max() - self.x_min()
+        x_min, x_max, _, _ = self.bounds()
+        return x_max - x_min
 
     def size(self) -> Tuple[float, float]:
         """
@@ -973,10 +1015,10 @@ class Strands:
 
         Notes:
             This is a convenience method that returns the width and height of the
-                strands container. If you don't need both, it is more efficient to
-                call the width() and height() methods directly.
+                strands container, from a single call to bounds().
         """
-        return self.width(), self.height()
+        x_min, x_max, y_min, y_max = self.bounds()
+        return x_max - x_min, y_max - y_min
 
     def to_json(self) -> dict:
         """
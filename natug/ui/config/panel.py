@@ -1,6 +1,6 @@
 import logging
 
-from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtCore import QTimer, pyqtSlot
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from PyQt6 import uic
 
@@ -40,6 +40,14 @@ class Panel(QWidget):
         self.sequencing = None
         self.snapshots = None
 
+        # Tab updates are funneled through a zero-interval single-shot timer so that
+        # several updates emitted within one event loop iteration (e.g. the domains
+        # tab emitting updated twice when importing) only recompute the strands once.
+        self._tab_update_timer = QTimer(self)
+        self._tab_update_timer.setSingleShot(True)
+        self._tab_update_timer.setInterval(0)
+        self._tab_update_timer.timeout.connect(self._on_tab_update)
+
         # Load the panel
         uic.loadUi("./ui/config/panel.ui", self)
         self.update_graphs.setIcon(fetch_icon("reload-outline"))
@@ -82,11 +90,12 @@ class Panel(QWidget):
         Sets up the following signals:
             self.domains.updated: When the domains tab has been updated.
             self.nucleic_acid.updated: When the nucleic acid tab has been updated.
+                Both of these are coalesced through a single-shot timer.
             self.tab_area.currentChanged: When the current tab has been changed.
             self.update_graphs.clicked: When the update graphs button has been clicked.
         """
-        self.domains.updated.connect(self._on_tab_update)
-        self.nucleic_acid.updated.connect(self._on_tab_update)
+        self.domains.updated.connect(self._tab_update_timer.start)
+        self.nucleic_acid.updated.connect(self._tab_update_timer.start)
         self.tab_area.currentChanged.connect(self._on_tab_change)
         self.update_graphs.clicked.connect(self._on_update_graphs)
         self.export_graphs.clicked.connect(self._on_export_graphs)
@@ -134,10 +143,9 @@ class Panel(QWidget):
                 # ensure that it displays the correct type of point
 
             # Enable all the potential modes for the toolbar
-            self.runner.managers.toolbar.actions.buttons[INFORMER].setEnabled(True)
-            self.runner.managers.toolbar.actions.buttons[NICKER].setEnabled(True)
-            self.runner.managers.toolbar.actions.buttons[LINKER].setEnabled(True)
-            self.runner.managers.toolbar.actions.buttons[JUNCTER].setEnabled(True)
+            self.runner.managers.toolbar.set_enabled(
+                informer=True, nicker=True, linker=True, juncter=True
+            )
 
         elif index in (STRANDS,):
             logger.info("The current tab has been changed to Strands")
@@ -152,7 +160,6 @@ class Panel(QWidget):
             self.runner.managers.toolbar.current = INFORMER
 
             # Enable all the potential modes for the toolbar
-            self.runner.managers.toolbar.actions.buttons[INFORMER].setEnabled(True)
-            self.runner.managers.toolbar.actions.buttons[NICKER].setEnabled(False)
-            self.runner.managers.toolbar.actions.buttons[LINKER].setEnabled(False)
-            self.runner.managers.toolbar.actions.buttons[JUNCTER].setEnabled(False)
+            self.runner.managers.toolbar.set_enabled(
+                informer=True, nicker=False, linker=False, juncter=False
+            )
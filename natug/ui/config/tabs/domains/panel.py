@@ -1,9 +1,8 @@
 import logging
-from copy import copy
-from functools import partial
+from contextlib import ExitStack
 
 import pandas as pd
-from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QSignalBlocker, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QFileDialog, QSizePolicy, QWidget
 from PyQt6 import uic
 
@@ -29,13 +28,49 @@ class DomainsPanel(QWidget):
 
     updated = pyqtSignal()
 
+    # The style of the M/R boxes when M/R is at its target
+    _on_target_style = (
+        f"QDoubleSpinBox{{"
+        f"background-color: rgb{settings.colors['success']}; "
+        f"color: rgb(0, 0, 0)}}"
+    )
+    # The style of the update table button right after a successful update
+    _success_button_style = f"background-color: rgb{settings.colors['success']}"
+
+    # The size policy of the settings area above the tables. QSizePolicy is a plain
+    # value type, so one instance is shared by all panels.
+    _config_size_policy = QSizePolicy(
+        QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
+    )
+
     def __init__(self, parent, runner: "runner.Runner") -> None:
         self.runner = runner
         super().__init__(parent)
         uic.loadUi("./ui/config/tabs/domains/panel.ui", self)
 
-        # Define internal attributes
-        self._pushing_updates = False
+        # Table and antiparallel updates are funneled through a short single-shot
+        # timer so that a burst of them (e.g. several cells edited in quick
+        # succession) results in only one domains update.
+        self._push_updates_timer = QTimer(self)
+        self._push_updates_timer.setSingleShot(True)
+        self._push_updates_timer.setInterval(75)
+        self._push_updates_timer.timeout.connect(self._push_updates)
+
+        # The key of the domains that were last dumped into the panel, so that dumping
+        # the same domains again can be skipped. Reset whenever the user edits the
+        # panel, since the panel then no longer reflects the dumped domains.
+        self._last_dump_key = None
+
+        # Whether the user has edited the tables or the antiparallel checkbox since
+        # the domains were last pushed or dumped. Pushing updates is skipped when
+        # they have not, since there would be nothing new to fetch from the tables.
+        self._tables_dirty = False
+
+        # The style currently applied to the M/R boxes, since reapplying a style
+        # sheet repolishes the widget even if the style is unchanged.
+        self._M_over_R_style = ""
+        # The M, N, B, and R that the M boxes were last set from
+        self._last_M_key = None
 
         # Add the main table areas
         self.tables = DomainsTablesArea(
@@ -80,69 +115,132 @@ class DomainsPanel(QWidget):
 
         Args:
             domains: The Domains object to dump.
+
+        Notes:
+            If the panel already shows these exact domains, nothing is dumped, but a
+            snapshot is still taken.
         """
-        self.tables.blockSignals(True)
-        self.symmetry.blockSignals(True)
-        self.auto_antiparallel.blockSignals(True)
-
-        # dump the current subunit into the subunit table
-        self.tables.dump_domains(domains.subunit.domains)
-
-        # set symmetry boxes
-        self.subunit_count.setValue(domains.subunit.count)
-        self.symmetry.setValue(domains.symmetry)
-
-        # set antiparallel checkbox
-        self.auto_antiparallel.setChecked(domains.antiparallel)
-
-        # clear the prefixes from the settings input boxes. the prefixes indicate the
-        # current state of the settings and what the user is attempting to change
-        # them to, but they now can be made blank since we're setting new settings
-        self.subunit_count.setPrefix("")
-        self.symmetry.setPrefix("")
-
-        # set M and target M boxes
-        # https://github.com/404Wolf/NATuG3/issues/4
-        M: int = sum([domain.theta_m_multiple for domain in domains.domains()])
-        N: int = domains.count
-        B: int = self.runner.managers.nucleic_acid_profile.current.B
-        R: int = domains.symmetry
-        target_M_over_R = (B * (N - 2)) / (2 * R)
-        M_over_R = M / R
+        self._tables_dirty = False
+
+        # Build the key and sum the subunit's theta_m_multiples in a single pass over
+        # the subunit. Every subunit is a copy of the template subunit (inverting a
+        # subunit only flips its joints), so M is just the subunit's sum times R.
+        rows = []
+        subunit_M = 0
+        for domain in domains.subunit.domains:
+            rows.append(
+                (
+                    domain.theta_m_multiple,
+                    domain.left_helix_joint,
+                    domain.right_helix_joint,
+                    domain.up_helix_count,
+                    domain.down_helix_count,
+                )
+            )
+            subunit_M += domain.theta_m_multiple
+
+        key = (
+            domains.symmetry,
+            domains.antiparallel,
+            self.runner.managers.nucleic_acid_profile.current._key(),
+            tuple(rows),
+        )
+        if key == self._last_dump_key:
+            self.runner.snapshot()
+            return
+
+        # Block the signals of every widget that is about to be set, so that
+        # setting them doesn't trigger a round of updates per widget.
+        with ExitStack() as blockers:
+            for widget in (
+                self.tables,
+                self.symmetry,
+                self.subunit_count,
+                self.auto_antiparallel,
+                self.M,
+                self.target_M_over_R,
+                self.M_over_R,
+            ):
+                blockers.enter_context(QSignalBlocker(widget))
+
+            # dump the current subunit into the subunit table
+            self.tables.dump_domains(domains.subunit.domains)
+
+            # set symmetry boxes
+            self.subunit_count.setValue(domains.subunit.count)
+            self.symmetry.setValue(domains.symmetry)
+
+            # set antiparallel checkbox
+            self.auto_antiparallel.setChecked(domains.antiparallel)
+
+            # clear the prefixes from the settings input boxes. the prefixes indicate
+            # the current state of the settings and what the user is attempting to
+            # change them to, but they now can be made blank since we're setting new
+            # settings
+            self.subunit_count.setPrefix("")
+            self.symmetry.setPrefix("")
+
+            # set M and target M boxes
+            # https://github.com/404Wolf/NATuG3/issues/4
+            self._dump_M(
+                M=subunit_M * domains.symmetry,
+                N=len(rows) * domains.symmetry,
+                B=self.runner.managers.nucleic_acid_profile.current.B,
+                R=domains.symmetry,
+            )
+
+        # the total count box is normally kept up to date by the blocked symmetry and
+        # subunit count signals
+        self._on_symmetry_setting_change()
+
+        self._last_dump_key = key
+        self.runner.snapshot()
+
+    def _dump_M(self, M: int, N: int, B: int, R: int) -> None:
+        """
+        Set the M, M/R, and target M/R boxes.
+
+        Nothing is done if M, N, B, and R are all the same as the last time.
+
+        Args:
+            M: The sum of the theta_m_multiples of all the domains.
+            N: The number of domains.
+            B: There are B bases every T turns.
+            R: The symmetry of the domains.
+        """
+        if (M, N, B, R) == self._last_M_key:
+            return
+
         self.M.setValue(M)
 
-        # remove trailing zeros if target_M_over_R is an int
-        if target_M_over_R == round(target_M_over_R):
+        # remove trailing zeros if target_M_over_R is an int, which it usually is
+        quotient, remainder = divmod(B * (N - 2), 2 * R)
+        if remainder == 0:
+            target_M_over_R = quotient
             self.target_M_over_R.setDecimals(0)
         else:
+            target_M_over_R = (B * (N - 2)) / (2 * R)
             self.target_M_over_R.setDecimals(3)
         self.target_M_over_R.setValue(target_M_over_R)
 
         # remove trailing zeros if M_over_R is an int
-        if M_over_R == round(M_over_R):
+        quotient, remainder = divmod(M, R)
+        if remainder == 0:
+            M_over_R = quotient
             self.M_over_R.setDecimals(0)
         else:
+            M_over_R = M / R
             self.M_over_R.setDecimals(3)
         self.M_over_R.setValue(M_over_R)
 
         # make M_over_R and target_M_over_R box green if it is the target
-        if M_over_R == target_M_over_R:
-            style = (
-                f"QDoubleSpinBox{{"
-                f"background-color: rgb{settings.colors['success']}; "
-                f"color: rgb(0, 0, 0)}}"
-            )
+        style = self._on_target_style if M_over_R == target_M_over_R else ""
+        if style != self._M_over_R_style:
             self.M_over_R.setStyleSheet(style)
-        else:
-            style = None
-        self.M_over_R.setStyleSheet(style)
-        self.target_M_over_R.setStyleSheet(style)
-
-        self.tables.blockSignals(False)
-        self.symmetry.blockSignals(False)
-        self.auto_antiparallel.blockSignals(False)
+            self.target_M_over_R.setStyleSheet(style)
+            self._M_over_R_style = style
 
-        self.runner.snapshot()
+        self._last_M_key = (M, N, B, R)
 
     def _prettify(self):
         """Set up styles of panel."""
@@ -154,58 +252,59 @@ class DomainsPanel(QWidget):
         self.rotate_down_button.setIcon(fetch_icon("chevron-down-outline"))
 
         # set scaling settings for config and table
-        config_size_policy = QSizePolicy()
-        config_size_policy.setVerticalPolicy(QSizePolicy.Policy.Fixed)
-        config_size_policy.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
-        self.config.setSizePolicy(config_size_policy)
+        self.config.setSizePolicy(self._config_size_policy)
 
     def _push_updates(self):
         """
         Warn the user if they are about to overwrite domain data, and if they are
         okay with that, then update the domains. Otherwise, revert to the old domains.
         """
-        if self._pushing_updates:
+        if not self._tables_dirty:
             return
-        self._pushing_updates = True
-
-        # Warn the user if they are about to overwrite strand data, and give them the
-        # opportunity to save the current state and then update the domains.
-        if RefreshConfirmer.run(self.runner):
-            new_domains = self.fetch_domains(
-                self.runner.managers.nucleic_acid_profile.current
-            )
-            for domain in new_domains.subunit:
-                domain.theta_m_multiple = (
-                    domain.theta_m_multiple
-                    % self.runner.managers.nucleic_acid_profile.current.B
-                )
 
-            if (
-                new_domains.antiparallel
-                and (
-                    new_domains.subunit[0].left_helix_joint
-                    == new_domains.subunit[-1].right_helix_joint
+        # Drop any pending debounced push, and keep the timer from calling back into
+        # this method while the confirmation dialogs run their own event loops.
+        self._push_updates_timer.stop()
+        with QSignalBlocker(self._push_updates_timer):
+            # Warn the user if they are about to overwrite strand data, and give them
+            # the opportunity to save the current state and then update the domains.
+            if RefreshConfirmer.run(self.runner):
+                new_domains = self.fetch_domains(
+                    self.runner.managers.nucleic_acid_profile.current
                 )
-                and (new_domains.symmetry % 2)
-            ):
-                utils.warning(
-                    self.runner.window,
-                    "Anti-parallelity Error",
-                    "Because the first domain in the template subunit's direction matches"
-                    " that of the last domain in the template subunit's direction, and "
-                    "there is an odd number of subunits, then the first and last helices"
-                    "cannot be anti-parallel. Please change the direction of the first "
-                    "domain's left helix joint direction.",
-                )
-            self.runner.managers.domains.current.update(new_domains)
-            self.dump_domains(new_domains)
-            self.updated.emit()
-            logger.debug("Updated domains.")
-        # They rather not update the domains, so revert to the old domains.
-        else:
-            self.dump_domains(self.runner.managers.domains.current)
-            logger.debug("Did not update domains because user chose not to.")
-        self._pushing_updates = False
+                for domain in new_domains.subunit:
+                    domain.theta_m_multiple = (
+                        domain.theta_m_multiple
+                        % self.runner.managers.nucleic_acid_profile.current.B
+                    )
+
+                if (
+                    new_domains.antiparallel
+                    and (
+                        new_domains.subunit[0].left_helix_joint
+                        == new_domains.subunit[-1].right_helix_joint
+                    )
+                    and (new_domains.symmetry % 2)
+                ):
+                    utils.warning(
+                        self.runner.window,
+                        "Anti-parallelity Error",
+                        "Because the first domain in the template subunit's direction "
+                        "matches that of the last domain in the template subunit's "
+                        "direction, and there is an odd number of subunits, then the "
+                        "first and last helices cannot be anti-parallel. Please change "
+                        "the direction of the first domain's left helix joint "
+                        "direction.",
+                    )
+                self.runner.managers.domains.current.update(new_domains)
+                self.dump_domains(new_domains)
+                self.updated.emit()
+                logger.debug("Updated domains.")
+            # They rather not update the domains, so revert to the old domains.
+            else:
+                self.dump_domains(self.runner.managers.domains.current)
+                logger.debug("Did not update domains because user chose not to.")
+        self._tables_dirty = False
 
     def _hook_signals(self):
         """
@@ -219,8 +318,30 @@ class DomainsPanel(QWidget):
             - update_table_button.clicked
             - table.helix_joint_updated
             - auto_antiparallel_button.clicked
+
+        Table cell and antiparallel updates are debounced through a single-shot
+        timer, while explicit button clicks push updates immediately.
         """
-        self.tables.cell_widget_updated.connect(self._push_updates)
+        # Once the user edits the panel it no longer shows the last dumped domains.
+        for signal in (
+            self.tables.cell_widget_updated,
+            self.tables.helix_joint_updated,
+            self.tables.row_value_changed,
+            self.symmetry.valueChanged,
+            self.subunit_count.valueChanged,
+            self.auto_antiparallel.stateChanged,
+        ):
+            signal.connect(self._forget_last_dump)
+
+        # Only these edits change what would be fetched from the tables.
+        for signal in (
+            self.tables.cell_widget_updated,
+            self.tables.helix_joint_updated,
+            self.auto_antiparallel.stateChanged,
+        ):
+            signal.connect(self._mark_tables_dirty)
+
+        self.tables.cell_widget_updated.connect(self._push_updates_timer.start)
 
         # Make sure that the total domain count is updated as the summands are changed.
         self.symmetry.valueChanged.connect(self._on_symmetry_setting_change)
@@ -232,7 +353,7 @@ class DomainsPanel(QWidget):
         # Reset the checked button when a helix joint is updated because the user has
         # opted out of the auto-antiparallel feature by changing the helix joint
         self.tables.helix_joint_updated.connect(self._on_helix_joint_updated)
-        self.auto_antiparallel.stateChanged.connect(self._push_updates)
+        self.auto_antiparallel.stateChanged.connect(self._on_auto_antiparallel_changed)
 
         # Set up the save/load buttons slots
         self.save_domains_button.clicked.connect(self._on_save_button_clicked)
@@ -246,6 +367,27 @@ class DomainsPanel(QWidget):
         self.subunit_count.valueChanged.connect(self._on_settings_panel_input_update)
         self.symmetry.valueChanged.connect(self._on_settings_panel_input_update)
 
+    @pyqtSlot()
+    def _forget_last_dump(self):
+        """Forget the last dumped domains, since the panel no longer shows them."""
+        self._last_dump_key = None
+
+    @pyqtSlot()
+    def _mark_tables_dirty(self):
+        """Mark the tables as edited since the domains were last pushed or dumped."""
+        self._tables_dirty = True
+
+    @pyqtSlot()
+    def _on_auto_antiparallel_changed(self):
+        """
+        Queue a domains update for when the antiparallel checkbox changes.
+
+        Notes:
+            stateChanged carries the check state as an int, which connecting it
+            straight to QTimer.start would pass along as the timer's new interval.
+        """
+        self._push_updates_timer.start()
+
     @pyqtSlot()
     def _on_rotate_down_button_clicked(self):
         """Rotate the domains down by one. Top domain becomes bottom domain."""
@@ -287,11 +429,20 @@ class DomainsPanel(QWidget):
 
     @pyqtSlot()
     def _on_table_update_button_clicked(self):
-        new_table_domains = copy(self.runner.managers.domains.current)
-        new_table_domains.subunit.count = self.subunit_count.value()
-        self.tables.dump_domains(new_table_domains.subunit.domains)
+        self.tables.dump_domains(
+            self.runner.managers.domains.current.subunit.resized(
+                self.subunit_count.value()
+            )
+        )
+        self._last_dump_key = None
+        self._tables_dirty = True
         self._push_updates()
 
+    @pyqtSlot()
+    def _reset_update_table_button_style(self):
+        """Reset the update table button's background after it was highlighted."""
+        self.update_table_button.setStyleSheet("background-color: light grey")
+
     @pyqtSlot()
     def _on_helix_joint_updated(self):
         self.auto_antiparallel.setChecked(False)
@@ -309,8 +460,7 @@ class DomainsPanel(QWidget):
                 f"Saving domains to {filepath}."
                 f"\nDomains being saved: {self.runner.managers.domains.current}"
             )
-            domains_df = self.runner.managers.domains.current.to_df(include_uuid=False)
-            domains_df.to_csv(filepath, index=False)
+            self.runner.managers.domains.current.to_csv(filepath, include_uuid=False)
 
     @pyqtSlot()
     def _on_load_button_clicked(self):
@@ -327,8 +477,9 @@ class DomainsPanel(QWidget):
                 nucleic_acid_profile=self.runner.managers.nucleic_acid_profile.current,
             )
             self.dump_domains(new_domains)
+            self._tables_dirty = True
+            # _push_updates emits updated itself if the user goes through with it
             self._push_updates()
-            self.updated.emit()
 
     @pyqtSlot()
     def _on_settings_panel_input_update(self):
@@ -379,23 +530,15 @@ class DomainsPanel(QWidget):
                 logger.info(
                     "User confirmed that they would like the subunit count reduced."
                 )
-                self.update_table_button.setStyleSheet(
-                    f"background-color: rgb{str(settings.colors['success'])}"
-                )
-                QTimer.singleShot(
-                    600,
-                    partial(
-                        self.update_table_button.setStyleSheet,
-                        "background-color: light grey",
-                    ),
-                )
+                self.update_table_button.setStyleSheet(self._success_button_style)
+                QTimer.singleShot(600, self._reset_update_table_button_style)
                 self.dump_domains(new_domains)
+
+            # Update the current domains. Whether or not the user confirmed, the table
+            # still holds exactly what new_domains was fetched from, so it can be
+            # reused instead of reading the whole table again.
+            self.runner.managers.domains.current.update(new_domains)
         else:
+            # The table is reverted to the current domains, which is what they
+            # would otherwise be updated with.
             self.dump_domains(old_domains)
-
-        # update current domains
-        self.runner.managers.domains.current.update(
-            self.fetch_domains(
-                nucleic_acid_profile=self.runner.managers.nucleic_acid_profile.current
-            )
-        )
@@ -11,10 +11,9 @@ logger = logging.getLogger(__name__)
 class DomainsAnglesTable(DomainsBaseTable):
     """Nucleic Acid Config Tab."""
 
+    top_headers = ("L-Joint", "R-Joint", "s", "m", "θi")
+
     def __init__(self, parent, nucleic_acid_profile: NucleicAcidProfile) -> None:
-        super().__init__(
-            parent,
-            ["L-Joint", "R-Joint", "s", "m", "θi"],
-        )
+        super().__init__(parent)
         # Store the nucleic acid nucleic_acid_profile
         self.nucleic_acid_profile = nucleic_acid_profile
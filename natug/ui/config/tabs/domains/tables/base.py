@@ -1,6 +1,6 @@
-from typing import List
+from typing import Tuple
 
-from PyQt6.QtCore import QEvent, Qt
+from PyQt6.QtCore import QEvent, QSignalBlocker, Qt
 from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import QAbstractItemView, QApplication, QHeaderView, QTableWidget
 
@@ -10,11 +10,15 @@ class DomainsBaseTable(QTableWidget):
     The parent table class for all tables in the domains tab.
 
     This table class has styles and tabbing events all set up.
+
+    Attributes:
+        top_headers: The labels of the columns of the table. Set by subclasses.
     """
 
-    def __init__(self, parent, headers: List[str]) -> None:
+    top_headers: Tuple[str, ...] = ()
+
+    def __init__(self, parent) -> None:
         super().__init__(parent)
-        self.top_headers = tuple(headers)
         self._headers()
         self._prettify()
 
@@ -35,36 +39,39 @@ class DomainsBaseTable(QTableWidget):
             if row == self.rowCount():
                 row = 0
 
-            # Ensure that the previous widget's data is saved
-            self.cellWidget(row, column).editingFinished.emit()
-            self.cell_widget_updated.emit()
-
-            # Disable signals temporarily
-            self.setTabKeyNavigation(False)
-            self.blockSignals(True)
-
             # Obtain the widget
             to_focus = self.cellWidget(row, column)
 
-            # Create a list of key press events to send
+            # Ensure that the widget's data is saved. Its editingFinished signal is
+            # what notifies the tables area that a cell widget was updated.
             if to_focus is not None:
-                # Change the table focus
-                self.setCurrentCell(row, column)
-                to_focus.setFocus()
-
-                # Simulate a control A press
-                QApplication.postEvent(
-                    to_focus,
-                    QKeyEvent(
-                        QEvent.Type.KeyPress,
-                        Qt.Key.Key_A,
-                        Qt.KeyboardModifier.ControlModifier,
-                    ),
-                )
-
-            # Unblock signals
-            self.blockSignals(False)
-            self.setTabKeyNavigation(True)
+                to_focus.editingFinished.emit()
+
+            # Disable signals temporarily. The blocker and the finally clause undo
+            # this even if focusing the widget raises.
+            self.setTabKeyNavigation(False)
+            try:
+                with QSignalBlocker(self):
+                    if to_focus is not None:
+                        # Change the table focus
+                        self.setCurrentCell(row, column)
+                        to_focus.setFocus()
+
+                        # Select the widget's contents, directly if it can do so
+                        # itself, otherwise by simulating a control A press
+                        if hasattr(to_focus, "selectAll"):
+                            to_focus.selectAll()
+                        else:
+                            QApplication.postEvent(
+                                to_focus,
+                                QKeyEvent(
+                                    QEvent.Type.KeyPress,
+                                    Qt.Key.Key_A,
+                                    Qt.KeyboardModifier.ControlModifier,
+                                ),
+                            )
+            finally:
+                self.setTabKeyNavigation(True)
         else:
             # Otherwise use the normal keypress event
             super().keyPressEvent(event)
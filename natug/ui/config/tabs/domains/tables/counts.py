@@ -10,8 +10,7 @@ logger = logging.getLogger(__name__)
 class DomainsCountsTable(DomainsBaseTable):
     """Nucleic Acid Config Tab."""
 
+    top_headers = ("Up Helix Counts", "Down Helix Counts")
+
     def __init__(self, parent) -> None:
-        super().__init__(
-            parent,
-            ["Up Helix Counts", "Down Helix Counts"],
-        )
+        super().__init__(parent)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Callable, List, Tuple
+from typing import List, Tuple
 
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtWidgets import QDoubleSpinBox, QTabWidget
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QTableWidgetItem, QTabWidget
 
 from natug.structures.domains import Domain
 from natug.structures.profiles import NucleicAcidProfile
@@ -19,8 +19,10 @@ class RowWidgets:
 
     Attributes:
         theta_m_multiple: User settable theta m multiple.
-        theta_s_multiple: Automatically computed switch angle multiple.
-        theta_i: The actual interior angle. Theta_c * theta_m_multiple.
+        theta_s_multiple: Automatically computed switch angle multiple. This is a
+            read-only item rather than a widget.
+        theta_i: The actual interior angle. Theta_c * theta_m_multiple. This is a
+            read-only item rather than a widget.
         left_helix_joint: User settable left helix joint direction.
         right_helix_joint: User settable right helix joint direction.
         up_helix_count: User settable values for the bottom, middle, and top of the
@@ -30,73 +32,47 @@ class RowWidgets:
     """
 
     theta_m_multiple: TableIntegerBox = None
-    theta_i: QDoubleSpinBox = None
-    theta_s_multiple: TableIntegerBox = None
+    theta_i: QTableWidgetItem = None
+    theta_s_multiple: QTableWidgetItem = None
     left_helix_joint: DirectionalButton = None
     right_helix_joint: DirectionalButton = None
     up_helix_count: TripleSpinbox = None
     down_helix_count: TripleSpinbox = None
 
-    def to_domain(self, nucleic_acid_profile: NucleicAcidProfile):
-        """Obtain a domain object from the data in the RowWidgets."""
-        return Domain(
-            nucleic_acid_profile=nucleic_acid_profile,
-            theta_m_multiple=self.theta_m_multiple.value(),
-            left_helix_joint=self.left_helix_joint.state,
-            right_helix_joint=self.right_helix_joint.state,
-            up_helix_count=self.up_helix_count.values(),
-            down_helix_count=self.down_helix_count.values(),
-        )
-
+    def values(self) -> tuple:
+        """
+        Obtain the user settable values of the row.
 
-class SmoothInteriorUpdating:
-    """
-    Automatic theta_m arrow click adjacent adjustments.
+        Returns:
+            The theta_m_multiple, left_helix_joint, right_helix_joint, up_helix_count,
+            and down_helix_count of the row, in that order.
+        """
+        return (
+            self.theta_m_multiple.value(),
+            self.left_helix_joint.state,
+            self.right_helix_joint.state,
+            self.up_helix_count.values(),
+            self.down_helix_count.values(),
+        )
 
-    Attributes:
-        rows (List(RowWidgets)): A list of all rows in the table.
-        signal (Callable): A signal to release when the value of a box changes.
-    """
+    def to_domain(self, nucleic_acid_profile: NucleicAcidProfile, values=None):
+        """
+        Obtain a domain object from the data in the RowWidgets.
 
-    def __init__(self, rows, signal: Callable):
-        self.rows = rows
-        self.signal = signal
-
-    def surrounding(self, i):
-        # make sure to wrap around to the beginning/end of the domains list
-        # if "i" is the length of the list or is 0
-        if i == (len(self.rows) - 1):
-            surrounding = (i - 1, i, 0)
-        elif i == 0:
-            surrounding = (len(self.rows) - 1, 0, i + 1)
-        else:
-            surrounding = (i - 1, i, i + 1)
-
-        surrounding = [
-            self.rows[surrounding[0]].theta_m_multiple,
-            self.rows[surrounding[1]].theta_m_multiple,
-            self.rows[surrounding[2]].theta_m_multiple,
-        ]
-
-        return surrounding
-
-    def down(self, i):
-        surrounding = self.surrounding(i)
-        surrounding[0].setValue(surrounding[0].value() + 1)
-        # It was just ticked down 1, so tick it down 1 more
-        surrounding[1].setValue(surrounding[1].value() - 1)
-        surrounding[2].setValue(surrounding[2].value() + 1)
-        # Release a signal since the value has changed
-        self.signal()
-
-    def up(self, i):
-        surrounding = self.surrounding(i)
-        surrounding[0].setValue(surrounding[0].value() - 1)
-        # it was just ticked up 1, so tick it up 1 more
-        surrounding[1].setValue(surrounding[1].value() + 1)
-        surrounding[2].setValue(surrounding[2].value() - 1)
-        # Release a signal since the value has changed
-        self.signal()
+        Args:
+            nucleic_acid_profile: The nucleic acid profile of the domain.
+            values: Previously read values() of the row. If None, the values are read
+                from the widgets.
+        """
+        theta_m_multiple, left, right, up_count, down_count = values or self.values()
+        return Domain(
+            nucleic_acid_profile=nucleic_acid_profile,
+            theta_m_multiple=theta_m_multiple,
+            left_helix_joint=left,
+            right_helix_joint=right,
+            up_helix_count=up_count,
+            down_helix_count=down_count,
+        )
 
 
 class DomainsTablesArea(QTabWidget):
@@ -110,10 +86,13 @@ class DomainsTablesArea(QTabWidget):
         cell_widget_updated: A signal to release when a cell widget is updated.
         helix_joint_updated: A signal to release when a helix joint is updated.
         triple_spinbox_updated: A signal to release when a triple spinbox is updated.
+        row_value_changed: A signal to release when the value of any row's theta_m or
+            count widget changes, even if editing has not finished.
     """
 
     cell_widget_updated = pyqtSignal()
     helix_joint_updated = pyqtSignal()
+    row_value_changed = pyqtSignal()
     triple_spinbox_updated = pyqtSignal(tuple)
 
     def __init__(self, parent, nucleic_acid_profile: NucleicAcidProfile) -> None:
@@ -121,6 +100,15 @@ class DomainsTablesArea(QTabWidget):
         self.nucleic_acid_profile = nucleic_acid_profile
         self.rows = []
 
+        # The values() of each row, or None for rows whose widgets have changed since
+        # their values were last read. Reading a widget's value is a call into Qt, so
+        # unchanged rows are not read again on every fetch.
+        self._cached_values = []
+
+        # The indices of the previous row, the row, and the next row for each row.
+        # The domains wrap around, so the first and last rows are adjacent.
+        self._neighbors = []
+
         self.angles_table = None
         self.angles_tab = None
         self._angles_tab()
@@ -140,108 +128,244 @@ class DomainsTablesArea(QTabWidget):
 
         Args:
             domains (List(Domain)): A list of all domains to dump.
+
+        Notes:
+            Existing row widgets are updated in place, and only the rows by which the
+            number of domains differs from the number of rows are added or removed.
+
+            Painting and the tables' signals are suspended while the rows are
+            written, so that the tables are laid out and repainted once rather than
+            once per cell widget.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.angles_table), QSignalBlocker(self.counts_table):
+                for row, domain in zip(self.rows, domains):
+                    self._update_row(row, domain)
+                if len(domains) != len(self.rows):
+                    self._resize_rows(domains)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._cached_values = [None] * len(self.rows)
+
+    def _resize_rows(self, domains: List[Domain]) -> None:
+        """
+        Add or remove rows at the end of the tables so there is one row per domain.
+
+        Rows that already exist are left as they are.
+
+        Args:
+            domains (List(Domain)): A list of all domains. New rows are created for
+                the domains past the current number of rows.
         """
-        # Create rows before we input widgets
+        old_count = len(self.rows)
+
+        # Drop the rows past the new count. The tables delete their widgets.
+        for row in self.rows[len(domains) :]:
+            self._disconnect_row(row)
+        del self.rows[len(domains) :]
         self.angles_table.setRowCount(len(domains))
         self.counts_table.setRowCount(len(domains))
 
-        # Clear the row widget container
-        self.rows.clear()
+        # Create rows for the domains past the old count
+        for index in range(old_count, len(domains)):
+            self.rows.append(self._create_row(index, domains[index]))
+
+        count = len(self.rows)
+        self._neighbors = [((i - 1) % count, i, (i + 1) % count) for i in range(count)]
 
         # Array for the index labels that go to the left of the table
-        side_headers = []
-
-        # insert all domains
-        for index, domain in enumerate(domains):
-            # Container for currently-being-added widgets
-            row = RowWidgets()
-
-            # Angles Table, Column 0 - left helical joint
-            row.left_helix_joint = DirectionalButton(
-                self, domains[index].left_helix_joint
-            )
-            row.left_helix_joint.clicked.connect(self.helix_joint_updated.emit)
-            row.left_helix_joint.clicked.connect(self.cell_widget_updated.emit)
-            self.angles_table.setCellWidget(index, 0, row.left_helix_joint)
-
-            # Angles Table, Column 1 - right helical joint
-            row.right_helix_joint = DirectionalButton(
-                self, domains[index].right_helix_joint
-            )
-            row.right_helix_joint.clicked.connect(self.helix_joint_updated.emit)
-            row.right_helix_joint.clicked.connect(self.cell_widget_updated.emit)
-            self.angles_table.setCellWidget(index, 1, row.right_helix_joint)
-
-            # Angles Table, Column 2 - theta switch multiple
-            row.theta_s_multiple = TableIntegerBox(domain.theta_s_multiple, minimum=-1)
-            row.theta_s_multiple.setEnabled(False)
-            self.angles_table.setCellWidget(index, 2, row.theta_s_multiple)
-
-            # Angles Table, Column 3 - theta interior multiple
-            row.theta_m_multiple = TableIntegerBox(
-                domain.theta_m_multiple,
-                show_buttons=True,
-                minimum=-999999,
-                maximum=999999,
-            )
-            row.theta_m_multiple.editingFinished.connect(self.cell_widget_updated.emit)
-            self.angles_table.setCellWidget(index, 3, row.theta_m_multiple)
-
-            # Angles Table, Column 5 - theta interior
-            row.theta_i = QDoubleSpinBox()
-            row.theta_i.setRange(0, 9999)
-            row.theta_i.setDecimals(2)
-            row.theta_i.setValue(domain.theta_i)
-            row.theta_i.setEnabled(False)
-            row.theta_i.setSuffix("°")
-            self.angles_table.setCellWidget(index, 4, row.theta_i)
-
-            # Counts Table, Column 0 - initial NEMid count for the up helix
-            row.up_helix_count = TripleSpinbox(domain.up_helix_count)
-            row.up_helix_count.editingFinished.connect(
-                lambda widget=row.up_helix_count: self.triple_spinbox_updated.emit(
-                    widget.values()
-                )
-            )
-            row.up_helix_count.editingFinished.connect(self.cell_widget_updated.emit)
-            self.counts_table.setCellWidget(index, 0, row.up_helix_count)
-
-            # Counts Table, Column 1 - initial NEMid count for the down helix
-            row.down_helix_count = TripleSpinbox(domain.down_helix_count)
-            row.down_helix_count.editingFinished.connect(
-                lambda widget=row.down_helix_count: self.triple_spinbox_updated.emit(
-                    widget.values()
-                )
-            )
-            row.down_helix_count.editingFinished.connect(self.cell_widget_updated.emit)
-            self.counts_table.setCellWidget(index, 1, row.down_helix_count)
-
-            # Store the index label that will be added to the left labels later
-            side_headers.append(f"#{index + 1}")
-
-            # append to the row storage container
-            self.rows.append(row)
-
-        smooth_interior_updating = SmoothInteriorUpdating(
-            self.rows, self.cell_widget_updated.emit
+        side_headers = [f"#{index + 1}" for index in range(len(domains))]
+        for table in self.angles_table, self.counts_table:
+            table.setVerticalHeaderLabels(side_headers)
+
+    def _create_row(self, index: int, domain: Domain) -> RowWidgets:
+        """
+        Create the widgets for a row of the tables, and place them in the tables.
+
+        Args:
+            index: The index of the row. The tables must already have this row.
+            domain: The domain to display in the row.
+
+        Returns:
+            The widgets of the new row.
+        """
+        # Container for currently-being-added widgets
+        row = RowWidgets()
+
+        # The widgets' signals are connected to slots shared by all rows, rather than
+        # to per-row closures, which would hold references back to the tables area.
+        # The slots find the row of the widget that sent the signal via row_index.
+
+        # Angles Table, Column 0 - left helical joint
+        row.left_helix_joint = DirectionalButton(self, domain.left_helix_joint)
+        row.left_helix_joint.row_index = index
+        row.left_helix_joint.clicked.connect(self._on_helix_joint_clicked)
+        self.angles_table.setCellWidget(index, 0, row.left_helix_joint)
+
+        # Angles Table, Column 1 - right helical joint
+        row.right_helix_joint = DirectionalButton(self, domain.right_helix_joint)
+        row.right_helix_joint.row_index = index
+        row.right_helix_joint.clicked.connect(self._on_helix_joint_clicked)
+        self.angles_table.setCellWidget(index, 1, row.right_helix_joint)
+
+        # Angles Table, Column 2 - theta switch multiple
+        row.theta_s_multiple = self._read_only_item(str(domain.theta_s_multiple))
+        self.angles_table.setItem(index, 2, row.theta_s_multiple)
+
+        # Angles Table, Column 3 - theta interior multiple
+        row.theta_m_multiple = TableIntegerBox(
+            domain.theta_m_multiple,
+            show_buttons=True,
+            minimum=-999999,
+            maximum=999999,
         )
+        row.theta_m_multiple.row_index = index
+        row.theta_m_multiple.editingFinished.connect(self.cell_widget_updated.emit)
+        row.theta_m_multiple.valueChanged.connect(self._on_row_value_changed)
+        self.angles_table.setCellWidget(index, 3, row.theta_m_multiple)
+
+        # Angles Table, Column 5 - theta interior
+        row.theta_i = self._read_only_item(f"{domain.theta_i:.2f}°")
+        self.angles_table.setItem(index, 4, row.theta_i)
+
+        # Counts Table, Column 0 - initial NEMid count for the up helix
+        row.up_helix_count = TripleSpinbox(domain.up_helix_count)
+        row.up_helix_count.row_index = index
+        row.up_helix_count.editingFinished.connect(self._on_helix_count_edited)
+        row.up_helix_count.valuesChanged.connect(self._on_row_value_changed)
+        self.counts_table.setCellWidget(index, 0, row.up_helix_count)
+
+        # Counts Table, Column 1 - initial NEMid count for the down helix
+        row.down_helix_count = TripleSpinbox(domain.down_helix_count)
+        row.down_helix_count.row_index = index
+        row.down_helix_count.editingFinished.connect(self._on_helix_count_edited)
+        row.down_helix_count.valuesChanged.connect(self._on_row_value_changed)
+        self.counts_table.setCellWidget(index, 1, row.down_helix_count)
+
+        # Keep theta_m_multiple within a turn, and nudge the neighbouring domains'
+        # theta_m_multiples when the arrows are clicked.
+        row.theta_m_multiple.editingFinished.connect(self._on_theta_m_edited)
+        row.theta_m_multiple.down_button_clicked.connect(self._on_nudge_down)
+        row.theta_m_multiple.up_button_clicked.connect(self._on_nudge_up)
+
+        return row
+
+    @staticmethod
+    def _disconnect_row(row: RowWidgets) -> None:
+        """
+        Disconnect all the signals of a row's widgets.
 
-        def modulo_theta_m_upon_change(widget):
-            widget.setValue(widget.value() % self.nucleic_acid_profile.B)
+        The tables only delete removed widgets later on, and a removed widget that
+        had focus still emits editingFinished as it loses it. Disconnecting them
+        first ensures removed rows never push updates or touch the row caches.
 
-        for index, row in enumerate(self.rows):
-            row.theta_m_multiple.editingFinished.connect(
-                lambda widget=row.theta_m_multiple: modulo_theta_m_upon_change(widget)
-            )
-            row.theta_m_multiple.down_button_clicked.connect(
-                lambda i=index: smooth_interior_updating.down(i)
-            )
-            row.theta_m_multiple.up_button_clicked.connect(
-                lambda i=index: smooth_interior_updating.up(i)
-            )
+        Args:
+            row: The widgets of the row to disconnect.
+        """
+        for signal in (
+            row.left_helix_joint.clicked,
+            row.right_helix_joint.clicked,
+            row.theta_m_multiple.editingFinished,
+            row.theta_m_multiple.valueChanged,
+            row.theta_m_multiple.down_button_clicked,
+            row.theta_m_multiple.up_button_clicked,
+            row.up_helix_count.editingFinished,
+            row.up_helix_count.valuesChanged,
+            row.down_helix_count.editingFinished,
+            row.down_helix_count.valuesChanged,
+        ):
+            try:
+                signal.disconnect()
+            except TypeError:
+                # The signal had no connections
+                pass
+
+    @pyqtSlot()
+    def _on_theta_m_edited(self) -> None:
+        """Wrap an edited theta_m_multiple box's value around to be less than B."""
+        widget = self.sender()
+        widget.setValue(widget.value() % self.nucleic_acid_profile.B)
+
+    @pyqtSlot()
+    def _on_nudge_down(self) -> None:
+        """Slot for when any row's theta_m down arrow is clicked."""
+        self._nudge(self.sender().row_index, -1)
+
+    @pyqtSlot()
+    def _on_nudge_up(self) -> None:
+        """Slot for when any row's theta_m up arrow is clicked."""
+        self._nudge(self.sender().row_index, 1)
+
+    def _nudge(self, i: int, step: int) -> None:
+        """
+        Automatic adjacent adjustments after a theta_m arrow click.
 
-        for table in self.angles_table, self.counts_table:
-            table.setVerticalHeaderLabels(side_headers)
+        Args:
+            i: The index of the row whose arrow was clicked.
+            step: 1 if the up arrow was clicked, or -1 if the down arrow was clicked.
+        """
+        neighbors = self._neighbors[i]
+        previous, current, following = (
+            self.rows[index].theta_m_multiple for index in neighbors
+        )
+        # Set all three values with the boxes' signals blocked, and then invalidate
+        # their rows directly, rather than once per box through valueChanged
+        with QSignalBlocker(previous), QSignalBlocker(current), QSignalBlocker(
+            following
+        ):
+            previous.setValue(previous.value() - step)
+            # It was just ticked by the step, so tick it by the step once more
+            current.setValue(current.value() + step)
+            following.setValue(following.value() - step)
+        for index in neighbors:
+            self._invalidate_row(index)
+        # Release a single signal since the values have changed
+        self.cell_widget_updated.emit()
+
+    @staticmethod
+    def _read_only_item(text: str) -> QTableWidgetItem:
+        """
+        Create a table item for a value that the user cannot edit.
+
+        Items are plain entries in the table's model, so they are far cheaper to
+        create and repaint than cell widgets. With no item flags set the item is
+        drawn greyed out and cannot be selected, like a disabled widget.
+
+        Args:
+            text: The text of the item.
+
+        Returns:
+            The read-only item.
+        """
+        item = QTableWidgetItem(text)
+        item.setFlags(Qt.ItemFlag.NoItemFlags)
+        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        return item
+
+    @staticmethod
+    def _update_row(row: RowWidgets, domain: Domain) -> None:
+        """
+        Update the widgets of an existing row to display a domain.
+
+        Spin boxes and items ignore values that they already hold, so only cells
+        whose values differ from the domain's are actually changed and repainted.
+
+        Args:
+            row: The widgets of the row to update.
+            domain: The domain to display in the row.
+        """
+        if row.left_helix_joint.state != domain.left_helix_joint:
+            row.left_helix_joint.state = domain.left_helix_joint
+            row.left_helix_joint.text_updater()
+        if row.right_helix_joint.state != domain.right_helix_joint:
+            row.right_helix_joint.state = domain.right_helix_joint
+            row.right_helix_joint.text_updater()
+        row.theta_s_multiple.setText(str(domain.theta_s_multiple))
+        row.theta_m_multiple.setValue(domain.theta_m_multiple)
+        row.theta_i.setText(f"{domain.theta_i:.2f}°")
+        row.up_helix_count.setValues(domain.up_helix_count)
+        row.down_helix_count.setValues(domain.down_helix_count)
 
     def fetch_domains(self) -> List[Domain]:
         """
@@ -253,10 +377,41 @@ class DomainsTablesArea(QTabWidget):
             A list of the domains that populate the domains table.
         """
         domains = []  # Output list of domains
-        for row in self.rows:
-            domains.append(row.to_domain(self.nucleic_acid_profile))
+        for index, row in enumerate(self.rows):
+            values = self._cached_values[index]
+            if values is None:
+                values = self._cached_values[index] = row.values()
+            domains.append(row.to_domain(self.nucleic_acid_profile, values))
         return domains
 
+    @pyqtSlot()
+    def _on_helix_joint_clicked(self) -> None:
+        """
+        Slot for when any row's helix joint button is clicked.
+
+        Every joint button is connected to this one slot, which finds the button's
+        row through the button's row_index.
+        """
+        self._invalidate_row(self.sender().row_index)
+        self.helix_joint_updated.emit()
+        self.cell_widget_updated.emit()
+
+    @pyqtSlot()
+    def _on_helix_count_edited(self) -> None:
+        """Slot for when any row's helix count triple spinbox is edited."""
+        self.triple_spinbox_updated.emit(self.sender().values())
+        self.cell_widget_updated.emit()
+
+    @pyqtSlot()
+    def _on_row_value_changed(self) -> None:
+        """Slot for when the value of any row's theta_m or count widget changes."""
+        self._invalidate_row(self.sender().row_index)
+        self.row_value_changed.emit()
+
+    def _invalidate_row(self, index: int) -> None:
+        """Mark a row's cached values as stale, so they are read again when needed."""
+        self._cached_values[index] = None
+
     def _hook_signals(self):
         """Hook up signals to slots."""
         self.triple_spinbox_updated.connect(self._on_triple_spinbox_updated)
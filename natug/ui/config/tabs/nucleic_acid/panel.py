@@ -2,7 +2,7 @@ import logging
 from copy import copy
 from typing import Dict
 
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget
 from PyQt6 import uic
 
@@ -45,6 +45,14 @@ class NucleicAcidPanel(QWidget):
         self.profiles: Dict[str, NucleicAcidProfile] = profiles
         self._pushing_updates = False
 
+        # Input updates are funneled through a short single-shot timer so that a
+        # burst of them (e.g. editingFinished firing on both return and focus loss)
+        # results in only one profile update.
+        self._input_update_timer = QTimer(self)
+        self._input_update_timer.setSingleShot(True)
+        self._input_update_timer.setInterval(50)
+        self._input_update_timer.timeout.connect(self._on_input_updated)
+
         uic.loadUi("./ui/config/tabs/nucleic_acid/panel.ui", self)
 
         # set all setting descriptions
@@ -149,7 +157,9 @@ class NucleicAcidPanel(QWidget):
 
         Hooks each input to the _on_input_updated slot. This slot is called when the
         user changes the value of an input and then clicks away from it. The slot
-        automatically handles updating the helix graph.
+        automatically handles updating the helix graph. The slot is invoked through
+        a debounce timer, so that many updates in quick succession only trigger it
+        once.
         """
         for input_ in (
             self.D,
@@ -161,11 +171,11 @@ class NucleicAcidPanel(QWidget):
             self.Z_c,
             self.Z_mate,
         ):
-            input_.editingFinished.connect(self._on_input_updated)
+            input_.editingFinished.connect(self._input_update_timer.start)
 
         def notes_area_altered_focus_out_event(*args, **kwargs):
             super(QPlainTextEdit, self.notes_area).focusOutEvent(*args, **kwargs)
-            self._on_input_updated()
+            self._input_update_timer.start()
 
         self.notes_area.focusOutEvent = notes_area_altered_focus_out_event
 
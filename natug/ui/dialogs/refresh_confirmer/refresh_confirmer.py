@@ -1,5 +1,5 @@
 import os
-from contextlib import suppress
+import re
 from datetime import datetime
 
 from PyQt6.QtWidgets import QDialog
@@ -49,13 +49,11 @@ class RefreshConfirmer(QDialog):
             **kwargs: Keyword arguments to pass to the dialog.
         """
         for strand in runner.managers.strands.current.strands:
-            needs_confirmation = False
-            if strand.interdomain():
-                needs_confirmation = True
-            else:
-                for base in strand.sequence:
-                    if base is not None:
-                        needs_confirmation = True
+            # A strand needs confirmation if it spans several domains or has any
+            # bases set. Stop scanning its sequence at the first set base.
+            needs_confirmation = strand.interdomain() or any(
+                base is not None for base in strand.sequence
+            )
 
             if needs_confirmation:
                 dialog = cls(runner)
@@ -83,19 +81,18 @@ class RefreshConfirmer(QDialog):
         # create a timestamp as a placeholder name for the save
         timestamp = datetime.now().strftime("%m-%d-%Y")
 
+        # Saves from today are named "mm-dd-yyyy_#.natug", so their counters can be
+        # matched and extracted from the filenames with a single regex.
+        save_pattern = re.compile(
+            rf"^{re.escape(timestamp)}_(\d+)\.{re.escape(settings.extension)}$"
+        )
+
         # create a list of counters
         counters = [1]
-        for filename in os.listdir(f"saves"):
-            # We don't care about the file extension, so we can remove it from the
-            # end of the filename.
-            filename = filename.replace(settings.extension, "")
-            # If today's timestamp is in the filename and the seperator "_" is in the
-            # filename, then, if everything that proceeds the "_" is a number, we can
-            # assume that the filename is of the format "mm-dd-yyyy_#", and thus
-            # store the number in the list of counters.
-            if timestamp in filename and "_" in filename:
-                with suppress(ValueError):
-                    counters.append(int(filename[filename.find("_") + 1 :]))
+        with os.scandir("saves") as saves:
+            for save in saves:
+                if match := save_pattern.match(save.name):
+                    counters.append(int(match.group(1)))
 
         # The counter for THIS save is the maximum of the list, and then we add 1 to
         # it since this is the next save from the maximal previous save.
@@ -1,5 +1,4 @@
 from functools import partial
-from threading import Thread
 from typing import Iterable, List
 
 from PyQt6.QtCore import QTimer, pyqtSignal
@@ -86,9 +85,7 @@ class SequenceEditorArea(QWidget):
         if len(bases) <= 0:
             raise ValueError("Not enough bases", bases)
         for index, base in enumerate(bases):
-            Thread(
-                target=lambda: QTimer.singleShot(1, partial(self.add_base, base))
-            ).run()
+            QTimer.singleShot(1, partial(self.add_base, base))
 
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -1,5 +1,4 @@
 import logging
-from functools import partial
 
 from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtWidgets import QGroupBox, QVBoxLayout
@@ -111,62 +110,77 @@ class SideViewPanel(QGroupBox):
 
         logger.info(f"Strand #%s was clicked.", strand.strands.index(strand))
 
+    @property
+    def _repeat(self):
+        """The action repeater profile to use, or None if repeating is off."""
+        if self.runner.window.toolbar.repeat.isChecked():
+            return self.runner.managers.misc.action_repeater
+        return None
+
+    def _inform(self, points) -> None:
+        """Open informers for a clicked point."""
+        workers.informer(
+            self.parent(),
+            points,
+            self.runner.managers.strands.current,
+            self.runner.managers.domains.current,
+            self.runner.window.side_view.refresh,
+        )
+
+    def _link(self, points) -> None:
+        """Create a linkage with a clicked point."""
+        workers.linker(
+            points,
+            self.runner.managers.strands.current,
+            self.runner.window.side_view.refresh,
+            self.runner,
+        )
+
+    def _junct(self, points) -> None:
+        """Create a junction at a clicked point."""
+        workers.juncter(
+            points,
+            self.runner.managers.strands.current,
+            self.runner.window.side_view.refresh,
+            self.runner,
+            self._repeat,
+        )
+
+    def _nick(self, points) -> None:
+        """Create or undo a nick at a clicked point."""
+        workers.nicker(
+            points,
+            self.runner.managers.strands.current,
+            self.runner,
+            self.runner.window.side_view.refresh,
+            self._repeat,
+        )
+
+    def _highlight(self, points) -> None:
+        """Highlight or un-highlight a clicked point."""
+        workers.highlighter(
+            points,
+            self.runner.window.side_view.refresh,
+            self._repeat,
+        )
+
+    # The method that handles a point click for each toolbar mode
+    _point_workers = {
+        INFORMER: _inform,
+        LINKER: _link,
+        JUNCTER: _junct,
+        NICKER: _nick,
+        HIGHLIGHTER: _highlight,
+    }
+
     @pyqtSlot(object)
     def _on_points_clicked(self, points) -> None:
         """
         Slot for when a point in the plot is clicked.
 
-        Utilizes a worker thread to handle the point click.
+        Runs the worker of the current toolbar mode on the point(s).
 
         Args:
             points: The points that were clicked.
         """
-        strands = self.runner.managers.strands.current
-        domains = self.runner.managers.domains.current
-        parent = self.parent()
-        refresh = self.runner.window.side_view.refresh
-
-        if self.runner.window.toolbar.repeat.isChecked():
-            repeat = self.runner.managers.misc.action_repeater
-        else:
-            repeat = None
-
-        {
-            INFORMER: partial(
-                workers.informer,
-                parent,
-                points,
-                strands,
-                domains,
-                refresh,
-            ),
-            LINKER: partial(
-                workers.linker,
-                points,
-                strands,
-                refresh,
-                self.runner,
-            ),
-            JUNCTER: partial(
-                workers.juncter,
-                points,
-                strands,
-                refresh,
-                self.runner,
-                repeat,
-            ),
-            NICKER: partial(
-                workers.nicker,
-                points,
-                strands,
-                self.runner,
-                refresh,
-                repeat,
-            ),
-            HIGHLIGHTER: partial(
-                workers.highlighter,
-                points,
-                refresh,
-                repeat,
-            ),
-        }[self.runner.managers.toolbar.current]()
+        self._point_workers[self.runner.managers.toolbar.current](self, points)
@@ -1,7 +1,7 @@
 import logging
 from contextlib import suppress
 from dataclasses import dataclass, field
-from math import ceil
+from math import ceil, floor
 from typing import Dict, Iterable, List, Tuple, Type
 
 import numpy as np
@@ -81,7 +81,6 @@ class PlotData:
         double_helices: The double helices underpinning the currently plotted strands.
         point_types: The currently plotted point types.
         modifiers: Various modifiers for the scale of various plot aspects.
-        points: A mapping of positions of plotted_points to point objects.
         plotted_points: The points.
         plotted_nicks: The nicks.
         plotted_linkages: The linkages.
@@ -95,7 +94,6 @@ class PlotData:
     double_helices: "DoubleHelices" = None
     point_types: Tuple[Type, ...] = field(default_factory=tuple)
     modifiers: PlotModifiers = field(default_factory=PlotModifiers)
-    points: Dict[Tuple[float, float], "Point"] = field(default_factory=dict)
     plotted_points: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_nicks: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_linkages: List[pg.PlotDataItem] = field(default_factory=list)
@@ -133,6 +131,10 @@ class SideViewPlotter(Plotter):
     strand_clicked = pyqtSignal(object, arguments=("Clicked Strand",))
     linkage_clicked = pyqtSignal(object, arguments=("Clicked Linkages",))
 
+    # Custom symbols by their text, rotation, and font. Symbols never change, so the
+    # cache is shared by all side view plotters, and survives across refreshes.
+    _symbols: Dict[Tuple[str, float, str | None], QPainterPath] = {}
+
     def __init__(
         self,
         strands: "Strands",
@@ -192,6 +194,19 @@ class SideViewPlotter(Plotter):
         # Misc. internal variables
         self._updating_viewbox = False
 
+        # Brushes and pens by their colors (and widths), so that everything drawn in
+        # the same style shares one Qt object. See _brush() and _pen().
+        self._brushes: Dict[tuple, QBrush] = {}
+        self._pens: Dict[Tuple[tuple, float], QPen] = {}
+
+        # Replots are run by a zero-interval single-shot timer. It allows one screen
+        # refresh for the mouse to release, and refresh calls made while a replot is
+        # already pending are absorbed into it.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.plot)
+
         # Plot data if requested
         if initial_plot:
             self.plot()
@@ -249,20 +264,18 @@ class SideViewPlotter(Plotter):
         return self.x_max - self.x_min
 
     def _set_dimensions(self):
-        self._x_min = self.strands.x_min()
-        self._x_max = self.strands.x_max()
-        self._y_min = self.strands.y_min()
-        self._y_max = self.strands.y_max()
+        self._x_min, self._x_max, self._y_min, self._y_max = self.strands.bounds()
 
     def refresh(self):
-        """Replot plot data."""
-
-        def runner():
-            self.plot()
+        """
+        Replot plot data.
 
-        # allow one screen refresh for the mouse to release
-        # so that the plot is cleared after the mouse release event happens
-        QTimer.singleShot(0, runner)
+        Notes:
+            The replot happens on the next pass of the event loop, so that the plot
+            is cleared after the mouse release event happens. However many times
+            this is called before then, the plot is only replotted once.
+        """
+        self._refresh_timer.start()
         logger.info("Refreshed side view.")
 
     def _reset(self, plot_data=None):
@@ -275,18 +288,22 @@ class SideViewPlotter(Plotter):
             self.removeItem(unstable_indicator)
         for points in plot_data.plotted_points:
             self.removeItem(points)
+        # Point items are reused by _plot_points(), so forget the removed ones.
+        plot_data.plotted_points.clear()
         for nick in plot_data.plotted_nicks:
             self.removeItem(nick)
         for linkage in plot_data.plotted_linkages:
             self.removeItem(linkage)
         for gridline in plot_data.plotted_gridlines:
             self.removeItem(gridline)
+        # Gridlines are reused by _plot_gridlines(), so forget the removed ones.
+        plot_data.plotted_gridlines.clear()
         self.clear()
 
     def _points_clicked(self, event, points):
         """Called when a point on a strand is clicked."""
-        position = tuple(points[0].pos())
-        self.points_clicked.emit(self.plot_data.points[position])
+        # Every plotted spot carries the point object that it represents as its data.
+        self.points_clicked.emit(points[0].data())
 
     def auto_range(self):
         """Configure the range for the plot automatically."""
@@ -311,6 +328,70 @@ class SideViewPlotter(Plotter):
         self.setLabel("bottom", text="x", units="Helical Diameters")
         self.setLabel("left", text="z", units="Nanometers")
 
+    def _brush(self, color: Iterable[int]) -> QBrush:
+        """
+        Obtain a brush of a given color.
+
+        Brushes are cached, so that all the items of the same color share one brush.
+
+        Args:
+            color: The color of the brush, as an iterable of 3-4 ints in the range
+                0-255.
+        """
+        color = tuple(color)
+        brush = self._brushes.get(color)
+        if brush is None:
+            brush = self._brushes[color] = pg.mkBrush(color=color)
+        return brush
+
+    def _pen(self, color: Iterable[int], width: float) -> QPen:
+        """
+        Obtain a pen of a given color and width.
+
+        Pens are cached, so that all the items of the same color and width share one
+        pen.
+
+        Args:
+            color: The color of the pen, as an iterable of 3-4 ints in the range 0-255.
+            width: The width of the pen.
+        """
+        key = (tuple(color), width)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = self._pens[key] = pg.mkPen(color=key[0], width=width)
+        return pen
+
+    def _custom_symbol(
+        self, symbol: str, rotation: float, font: str | None
+    ) -> QPainterPath:
+        """
+        Obtain a custom symbol with a given rotation and font.
+
+        Symbols are cached by the name of their font, rather than by a QFont, so that
+        all the points with the same symbol, rotation, and font share one
+        QPainterPath, across all plotters and refreshes.
+
+        Args:
+            symbol: The text of the symbol.
+            rotation: The rotation of the symbol.
+            font: The name of the font of the symbol, or None for the default font.
+        """
+        key = (symbol, rotation, font)
+        path = self._symbols.get(key)
+        if path is None:
+            if font is None:
+                path = custom_symbol(symbol, flip=False, rotation=rotation)
+            else:
+                path = custom_symbol(
+                    symbol, flip=False, rotation=rotation, font=QFont(font)
+                )
+            assert isinstance(path, QPainterPath), (
+                "Custom symbol must be of type QPainterPath, but is of type"
+                f" {type(path)}"
+            )
+            self._symbols[key] = path
+        return path
+
     def _fetch_gridline_pen(self, unstable: bool = False):
         """
         Fetch the pen to use for gridlines.
@@ -320,224 +401,294 @@ class SideViewPlotter(Plotter):
                 If True, the pen will be styled slightly differently (red, thicker).
         """
         if unstable:
-            return pg.mkPen(
-                color=settings.colors["grid_lines"]["unstable"],
-                width=3 + self.modifiers.gridline_mod,
+            return self._pen(
+                settings.colors["grid_lines"]["unstable"],
+                3 + self.modifiers.gridline_mod,
             )
         else:
-            return pg.mkPen(
-                color=settings.colors["grid_lines"]["default"],
-                width=self.modifiers.gridline_mod,
+            return self._pen(
+                settings.colors["grid_lines"]["default"],
+                self.modifiers.gridline_mod,
             )
 
-    def _plot_vertical_gridline(self, x: float, unstable: bool = False):
+    def _plot_vertical_gridline(
+        self, x: float, pen: QPen, pool: List[pg.InfiniteLine]
+    ):
         """
         Plot a vertical gridline at a given x coord.
 
         Args:
             x: The x coord to plot the gridline at.
-            unstable: Whether the gridline is for an unstable joint. Defaults to False.
-                If True, the pen will be styled slightly differently (red, thicker).
+            pen: The pen to draw the gridline with. See _fetch_gridline_pen().
+            pool: Previously plotted vertical gridlines that may be reused.
         """
-        self.plot_data.plotted_gridlines.append(
-            self.addLine(
-                x=x,
-                pen=self._fetch_gridline_pen(unstable=unstable),
-            )
-        )
-        self.plot_data.plotted_gridlines[-1].setZValue(-10)
+        if pool:
+            gridline = pool.pop()
+            gridline.setPos(x)
+            gridline.setPen(pen)
+        else:
+            gridline = self.addLine(x=x, pen=pen)
+            gridline.setZValue(-10)
+        self.plot_data.plotted_gridlines.append(gridline)
 
-    def _plot_horizontal_gridline(self, x: float):
+    def _plot_horizontal_gridline(
+        self, y: float, pen: QPen, pool: List[pg.InfiniteLine]
+    ):
         """
         Plot a horizontal gridline at a given y coord.
 
         Args:
             y: The y coord to plot the gridline at.
+            pen: The pen to draw the gridline with. See _fetch_gridline_pen().
+            pool: Previously plotted horizontal gridlines that may be reused.
         """
-        self.plot_data.plotted_gridlines.append(
-            self.addLine(
-                y=x,
-                pen=self._fetch_gridline_pen(),
-            )
-        )
-        self.plot_data.plotted_gridlines[-1].setZValue(-10)
+        if pool:
+            gridline = pool.pop()
+            gridline.setPos(y)
+            gridline.setPen(pen)
+        else:
+            gridline = self.addLine(y=y, pen=pen)
+            gridline.setZValue(-10)
+        self.plot_data.plotted_gridlines.append(gridline)
 
     def _plot_gridlines(self):
-        """Plot the gridlines."""
-        # Remove the preexisting gridlines
+        """
+        Plot the gridlines.
+
+        Notes:
+            Previously plotted gridlines are moved into place and reused, and only
+            the ones that are left over are removed from the plot.
+        """
+        # Sort the preexisting gridlines into pools of vertical and horizontal ones
+        vertical_pool = []
+        horizontal_pool = []
         for gridline in self.plot_data.plotted_gridlines:
-            self.removeItem(gridline)
+            if gridline.angle == 90:
+                vertical_pool.append(gridline)
+            else:
+                horizontal_pool.append(gridline)
 
         # Clear preexisting plotted_gridlines
-        self.plot_data.plotted_gridlines.clear()
+        self.plot_data.plotted_gridlines = []
+
+        # Only two distinct pens are ever needed, so create them once and share them
+        # between all the gridlines.
+        stable_pen = self._fetch_gridline_pen()
+        unstable_pen = self._fetch_gridline_pen(unstable=self.show_unstable_joints)
 
         for index, double_helix in enumerate(self.double_helices):
             if double_helix.right_joint_is_stable():
-                self._plot_vertical_gridline(index + 1)
+                self._plot_vertical_gridline(index + 1, stable_pen, vertical_pool)
             else:
-                self._plot_vertical_gridline(
-                    index + 1, unstable=self.show_unstable_joints
-                )
+                self._plot_vertical_gridline(index + 1, unstable_pen, vertical_pool)
 
         # Check if the joint on the very right side of the screen is unstable by
         # looking at the first domain's left joint.
         if self.double_helices[0].left_joint_is_stable():
-            self._plot_vertical_gridline(0)
+            self._plot_vertical_gridline(0, stable_pen, vertical_pool)
         else:
-            self._plot_vertical_gridline(0, unstable=self.show_unstable_joints)
+            self._plot_vertical_gridline(0, unstable_pen, vertical_pool)
 
         # Plot the horizontal gridlines for each helical twist
         with suppress(ZeroDivisionError):
             # For i in <number of helical twists of the tallest domain> add grid lines.
             for i in range(0, ceil(self.height / self.nucleic_acid_profile.H)):
-                self._plot_horizontal_gridline(i * self.nucleic_acid_profile.H)
+                self._plot_horizontal_gridline(
+                    i * self.nucleic_acid_profile.H, stable_pen, horizontal_pool
+                )
+
+        # Remove the preexisting gridlines that were not reused
+        for gridline in vertical_pool + horizontal_pool:
+            self.removeItem(gridline)
 
     def _plot_points(self):
         """
         Plot all the points that run along the strands.
 
         This method automatically updates plot_data.plotted_points.
-        """
-        for points in self.plot_data.plotted_points:
-            self.removeItem(points)
-        self.plot_data.plotted_points.clear()
-        self.plot_data.points.clear()
 
-        for strand_index, strand in enumerate(self.strands):
+        Notes:
+            Previously plotted point items are reused through setData() where
+            possible, instead of being removed from the plot and rebuilt. They are
+            raised above the strokes and gridlines, which are re-added on every plot.
+        """
+        previous_points = self.plot_data.plotted_points
+        self.plot_data.plotted_points = []
+
+        # All hidden points are drawn identically, so they share a single style.
+        hidden_point_brush = self._brush((30, 30, 30))
+        hidden_point_style = ("o", 2, hidden_point_brush, None)
+        hidden_point_key = ("o", 2, id(hidden_point_brush), id(None))
+
+        # Values that are the same for every point are looked up once here, rather
+        # than once per point within the loop below.
+        point_types = self.point_types
+        dot_hidden_points = self.dot_hidden_points
+        point_outline_mod = self.modifiers.point_outline_mod
+        NEMid_mod = self.modifiers.NEMid_mod
+        nucleoside_mod = self.modifiers.nucleoside_mod
+
+        # The points of all the strands are grouped by their (symbol, size, brush,
+        # pen) styles, so that each group can be plotted as one item with scalar
+        # styles, instead of pyqtgraph having to resolve the styles of every single
+        # spot of an item per strand. Since symbols, brushes, and pens are all
+        # cached, their ids can stand in for them.
+        groups: Dict[tuple, int] = {}
+        group_styles: List[tuple] = []
+
+        # The points, coords, and groups of the points of each strand.
+        all_points: List[Point] = []
+        all_x_coords: List[np.ndarray] = []
+        all_z_coords: List[np.ndarray] = []
+        all_point_groups: List[np.ndarray] = []
+
+        for strand in self.strands:
             # First plot all the points
             to_plot = strand.items.by_type(Point)
 
-            # create containers for plotting data
-            symbols = np.empty(len(to_plot), dtype=object)
-            symbol_sizes = np.empty(len(to_plot), dtype=int)
-            symbol_brushes = np.empty(len(to_plot), dtype=QBrush)
-            symbol_pens = np.empty(len(to_plot), dtype=QPen)
-            x_coords = np.empty(len(to_plot), dtype=float)
-            z_coords = np.empty(len(to_plot), dtype=float)
-
-            # Now create the proper plot data for each point one by one
-            for point_index, point in enumerate(to_plot):
-                # For points that are overlapping on the integrer line, they will be
-                # plotted slightly differently.
-                if point.x_coord % 1 == 0:
-                    # If the point is on the right side of its domain (i.e. the
-                    # point's domain x coord = index + 1) then we will shift it
-                    # slightly to the left so that it is not obscured by the other
-                    # point that is on top of it. Otherwise, we will shift it
-                    # slightly to the right.
-                    if (
-                        # Points that are on the very left (x=0) or the very right (
-                        # x=the number of domains) will not be shifted.
-                        point.x_coord == 0
-                        or point.x_coord == self.domains.count
-                    ):
-                        x_coord = point.x_coord
-                    else:
-                        if point.domain.index == point.x_coord:
-                            x_coord = point.x_coord + settings.domain_line_point_shift
-                        else:
-                            x_coord = point.x_coord - settings.domain_line_point_shift
-                else:
-                    x_coord = point.x_coord
-                z_coord = point.z_coord
+            # Each point's group is recorded in a preallocated array, and points that
+            # are not plotted at all are left in group -1.
+            point_groups = np.full(len(to_plot), -1, dtype=np.intp)
 
-                x_coords[point_index] = x_coord
-                z_coords[point_index] = z_coord
+            # Pull the coords of all the points into arrays in one go, so that the
+            # points on the integer lines can be shifted all at once.
+            x_coords = np.fromiter(
+                (point.x_coord for point in to_plot), dtype=float, count=len(to_plot)
+            )
+            z_coords = np.fromiter(
+                (point.z_coord for point in to_plot), dtype=float, count=len(to_plot)
+            )
 
-                # Update the point mappings. This is a dict that allows us to map the
-                # location of a given point to the point object itself.
-                self.plot_data.points[(x_coord, z_coord)] = point
+            # For points that are overlapping on the integrer line, they will be
+            # plotted slightly differently. If the point is on the right side of its
+            # domain (i.e. the point's domain x coord = index + 1) then we will shift
+            # it slightly to the left so that it is not obscured by the other point
+            # that is on top of it. Otherwise, we will shift it slightly to the
+            # right. Points that are on the very left (x=0) or the very right (x=the
+            # number of domains) will not be shifted.
+            overlapping = np.flatnonzero(
+                (x_coords % 1 == 0)
+                & (x_coords != 0)
+                & (x_coords != self.domains.count)
+            )
+            if len(overlapping):
+                domain_indices = np.fromiter(
+                    (to_plot[index].domain.index for index in overlapping),
+                    dtype=float,
+                    count=len(overlapping),
+                )
+                x_coords[overlapping] += np.where(
+                    domain_indices == x_coords[overlapping],
+                    settings.domain_line_point_shift,
+                    -settings.domain_line_point_shift,
+                )
 
+            # Now create the proper plot data for each point one by one
+            for point_index, point in enumerate(to_plot):
                 # If the point type is NOT the same as the active point type, use the
                 # current styles of the point. Otherwise, plot a smaller "o" shaped
                 # point to indicate that the point is not the active point type,
                 # but still exists.
-                if not isinstance(point, self.point_types):
-                    if self.dot_hidden_points:
-                        symbols[point_index] = "o"
-                        symbol_sizes[point_index] = 2
-                        symbol_brushes[point_index] = pg.mkBrush(color=(30, 30, 30))
-                        symbol_pens[point_index] = None
+                if not isinstance(point, point_types):
+                    if not dot_hidden_points:
+                        continue
+                    style, key = hidden_point_style, hidden_point_key
                 else:
+                    styles = point.styles
                     # if the symbol is a custom symbol, use the custom symbol
-                    if point.styles.symbol_is_custom():
-                        if point.styles.font is None:
-                            symbols[point_index] = custom_symbol(
-                                point.styles.symbol,
-                                flip=False,
-                                rotation=point.styles.rotation,
-                            )
-                        else:
-                            symbols[point_index] = custom_symbol(
-                                point.styles.symbol,
-                                flip=False,
-                                rotation=point.styles.rotation,
-                                font=QFont(point.styles.font),
-                            )
-                        assert isinstance(symbols[point_index], QPainterPath), (
-                            "Custom symbol must be of type QPainterPath, but is of type"
-                            f" {type(symbols[point_index])}"
+                    if styles.symbol_is_custom():
+                        symbol = self._custom_symbol(
+                            styles.symbol, styles.rotation, styles.font
                         )
                     else:
-                        assert point.styles.symbol in PointStyles.all_symbols, (
-                            f'Symbol "{point.styles.symbol} "is not a valid symbol. '
+                        assert styles.symbol in PointStyles.all_symbols, (
+                            f'Symbol "{styles.symbol} "is not a valid symbol. '
                             "Valid symbols are: "
                             f"{PointStyles.all_symbols}"
                         )
-                        symbols[point_index] = point.styles.symbol
+                        symbol = styles.symbol
 
-                    outline_width = (
-                        point.styles.outline[1] * self.modifiers.point_outline_mod
-                    )
+                    outline_width = styles.outline[1] * point_outline_mod
                     if isinstance(point, NEMid):
-                        symbol_sizes[point_index] = (
-                            point.styles.size * self.modifiers.NEMid_mod
-                        )
+                        symbol_size = styles.size * NEMid_mod
                         if point.junctable:
-                            outline_width = point.styles.outline[1]
+                            outline_width = styles.outline[1]
                     elif isinstance(point, Nucleoside):
-                        symbol_sizes[point_index] = (
-                            point.styles.size * self.modifiers.nucleoside_mod
-                        )
+                        symbol_size = styles.size * nucleoside_mod
                     else:
-                        symbol_sizes[point_index] = point.styles.size
-                        outline_width = point.styles.outline[1]
-
-                    # Create a brush for the symbol, based on the point's styles.
-                    symbol_brushes[point_index] = pg.mkBrush(
-                        color=point.styles.fill,
+                        symbol_size = styles.size
+                        outline_width = styles.outline[1]
+
+                    style = (
+                        symbol,
+                        int(symbol_size),
+                        # Obtain a brush for the symbol, based on the point's styles.
+                        self._brush(styles.fill),
+                        # Obtain a pen for the symbol, based on the point's styles.
+                        (
+                            self._pen(styles.outline[0], outline_width)
+                            if outline_width > 0
+                            else None
+                        ),
                     )
-
-                    # Create a pen for the symbol, based on the point's styles.
-                    symbol_pens[point_index] = (
-                        pg.mkPen(
-                            color=point.styles.outline[0],
-                            width=outline_width,
-                        )
-                        if outline_width > 0
-                        else None
+                    key = (
+                        symbol if isinstance(symbol, str) else id(symbol),
+                        style[1],
+                        id(style[2]),
+                        id(style[3]),
                     )
 
-            # Graph the plot for the points and for the strokes separately. First we
-            # will plot the points.
-            plotted_points = pg.PlotDataItem(
-                x_coords,
-                z_coords,
-                symbol=symbols,  # type of symbol (in this case up/down arrow)
-                symbolSize=symbol_sizes,  # size of arrows in px
+                if key not in groups:
+                    groups[key] = len(group_styles)
+                    group_styles.append(style)
+                point_groups[point_index] = groups[key]
+
+            all_points.extend(to_plot)
+            all_x_coords.append(x_coords)
+            all_z_coords.append(z_coords)
+            all_point_groups.append(point_groups)
+
+        if all_points:
+            x_coords = np.concatenate(all_x_coords)
+            z_coords = np.concatenate(all_z_coords)
+            point_groups = np.concatenate(all_point_groups)
+
+        # Graph the plot for the points and for the strokes separately. First we
+        # will plot the points, one plot per group of identically styled points.
+        for group_index, style in enumerate(group_styles):
+            symbol, symbol_size, symbol_brush, symbol_pen = style
+            in_group = point_groups == group_index
+            plot_args = dict(
+                # Each spot's data is its point, so clicks map straight to points
+                data=[all_points[index] for index in np.flatnonzero(in_group)],
+                symbol=symbol,  # type of symbol (in this case up/down arrow)
+                symbolSize=symbol_size,  # size of arrows in px
                 pxMode=True,
-                symbolBrush=symbol_brushes,  # set color of points to current color
-                symbolPen=symbol_pens,
+                symbolBrush=symbol_brush,  # set color of points to current color
+                symbolPen=symbol_pen,
                 pen=None,
                 skipFiniteCheck=True,
-                name=f"Strand#{strand_index} Points",
+                name=f"Points#{group_index}",
             )
-            # When a point is clicked, invoke the _points_clicked method.
-            plotted_points.sigPointsClicked.connect(self._points_clicked)
+            reused = len(self.plot_data.plotted_points)
+            if reused < len(previous_points):
+                plotted_points = previous_points[reused]
+                plotted_points.setData(
+                    x_coords[in_group], z_coords[in_group], **plot_args
+                )
+            else:
+                plotted_points = pg.PlotDataItem(
+                    x_coords[in_group], z_coords[in_group], **plot_args
+                )
+                plotted_points.setZValue(1)
+                # When a point is clicked, invoke the _points_clicked method.
+                plotted_points.sigPointsClicked.connect(self._points_clicked)
+                self.addItem(plotted_points)
             self.plot_data.plotted_points.append(plotted_points)
 
-        for points in self.plot_data.plotted_points:
-            self.addItem(points)
+        # Remove the previously plotted point items that were not reused.
+        for points in previous_points[len(self.plot_data.plotted_points) :]:
+            self.removeItem(points)
 
     def _plot_strands(self):
         """
@@ -560,6 +711,9 @@ class SideViewPlotter(Plotter):
 
         for strand_index, strand in enumerate(self.strands.strands):
             strand_with_linkage = strand.has_linkage()
+            # All the stroke segments of the strand share the same pen, so they are
+            # gathered here and plotted as a single NaN-separated plot data item.
+            stroke_pieces: List[Tuple[np.ndarray, np.ndarray]] = []
 
             # A strand consists of items connected by a visual stroke. However,
             # linkages receive a special stroke that has a special color, style,
@@ -580,10 +734,16 @@ class SideViewPlotter(Plotter):
                     stroke_length = len(stroke_segment)
                 x_coords = np.zeros(stroke_length, dtype=float)
                 z_coords = np.zeros(stroke_length, dtype=float)
-
-                for point_index, point in enumerate(stroke_segment):
-                    x_coords[point_index] = point.x_coord
-                    z_coords[point_index] = point.z_coord
+                x_coords[: len(stroke_segment)] = np.fromiter(
+                    (point.x_coord for point in stroke_segment),
+                    dtype=float,
+                    count=len(stroke_segment),
+                )
+                z_coords[: len(stroke_segment)] = np.fromiter(
+                    (point.z_coord for point in stroke_segment),
+                    dtype=float,
+                    count=len(stroke_segment),
+                )
 
                 # If the strand is closed, we will be adding a pseudo point to the
                 # end of the stroke segment. If the last point and the first point
@@ -622,17 +782,17 @@ class SideViewPlotter(Plotter):
                     # "connect" feature, because we will later round the edges of
                     # strokes.
                     if len(self.domains) > 2:
-                        for index, point in enumerate(stroke_segment[:-1]):
-                            # We will be looking ahead to the next point to determine
-                            # whether we have crossed the screen, so we will skip the last
-                            # point and worry about it later.
-                            splitter[index + 1] = (
-                                abs(
-                                    point.domain.index
-                                    - stroke_segment[index + 1].domain.index
-                                )
-                                == self.domains.count - 1
-                            )
+                        # We will be comparing each point to the next point to
+                        # determine whether we have crossed the screen, so the last
+                        # point is skipped here and worried about later.
+                        domain_indices = np.fromiter(
+                            (point.domain.index for point in stroke_segment),
+                            dtype=int,
+                            count=len(stroke_segment),
+                        )
+                        splitter[1 : len(stroke_segment)] = (
+                            np.abs(np.diff(domain_indices)) == self.domains.count - 1
+                        )
 
                     strand.cross_screen = splitter.any()
 
@@ -662,7 +822,7 @@ class SideViewPlotter(Plotter):
                 def plot_stroke(
                     x_coords: Iterable[float], z_coords: Iterable[float], smooth: bool
                 ):
-                    """Plot a single stroke segement."""
+                    """Queue a single stroke segment to be plotted with the strand."""
                     if smooth:
                         # Round the subarrays' edges using Chaikin's corner
                         # cutting algorithm.
@@ -674,36 +834,21 @@ class SideViewPlotter(Plotter):
                         x_coords = rounded_coords[:, 0]
                         z_coords = rounded_coords[:, 1]
 
-                    stroke_pen = pg.mkPen(
-                        color=strand.styles.color.value,
-                        width=(
-                            strand.styles.thickness.value * self.modifiers.stroke_mod
-                        ),
-                    )
-
-                    # Create the actual plot data item for the stroke segment.
-                    plotted_stroke = pg.PlotDataItem(
-                        x_coords,
-                        z_coords,
-                        pen=stroke_pen,
-                        name=f"Strand#{strand_index} Stroke#"
-                        f"{stroke_segment_index}/{len(stroke_segment)}",
-                    )
-                    # Make it so that the stroke itself can be clicked.
-                    plotted_stroke.setCurveClickable(True)
-                    # When the stroke is clicked, emit the strand_clicked
-                    # signal. This will lead to the creation of a
-                    # StrandConfig dialog.
-                    plotted_stroke.sigClicked.connect(
-                        lambda *args, f=strand: self.strand_clicked.emit(f)
-                    )
-                    # Store the stroke plotter object, which will be used later.
-                    self.plot_data.plotted_strokes.append(plotted_stroke)
+                    stroke_pieces.append((x_coords, z_coords))
 
                 for x_coords_subarray, z_coords_subarray in zip(
                     x_coords_subarrays, z_coords_subarrays
                 ):
-                    plot_stroke(x_coords_subarray, z_coords_subarray, interdomain)
+                    # Subarrays that lie within a single domain are drawn like the
+                    # strokes of strands that are not interdomain, so rounding their
+                    # edges is skipped. So is rounding of subarrays that are too short
+                    # to have any corners.
+                    smooth = (
+                        interdomain
+                        and len(x_coords_subarray) > 2
+                        and x_coords_subarray.max() - floor(x_coords_subarray.min()) > 1
+                    )
+                    plot_stroke(x_coords_subarray, z_coords_subarray, smooth)
 
                 if strand.cross_screen:
                     for wrap in strand.wraps(self.domains.count):
@@ -724,17 +869,18 @@ class SideViewPlotter(Plotter):
                     coords = chaikins_corner_cutting(coords, refinements=3)
                     # Split the coordinates into x and z coordinate arrays for
                     # plotting with pyqtgraph.
-                    x_coords = [coord[0] for coord in coords]
-                    z_coords = [coord[1] for coord in coords]
+                    x_coords = coords[:, 0]
+                    z_coords = coords[:, 1]
 
                     # Create the plot data item for the linkage.
                     plotted_linkage = pg.PlotDataItem(
                         x_coords,
                         z_coords,
-                        pen=pg.mkPen(  # Create a pen for the linkage
-                            color=linkage.styles.color,
-                            width=linkage.styles.thickness * self.modifiers.stroke_mod,
+                        pen=self._pen(  # Obtain a pen for the linkage
+                            linkage.styles.color,
+                            linkage.styles.thickness * self.modifiers.stroke_mod,
                         ),
+                        skipFiniteCheck=True,
                         name=f"Strand#{strand_index} Linkage#{linkage_index}",
                     )
                     # Make it so that the linkage itself can be clicked.
@@ -751,6 +897,39 @@ class SideViewPlotter(Plotter):
                     # actually plotting the linkage later.
                     self.plot_data.plotted_linkages.append(plotted_linkage)
 
+            if stroke_pieces:
+                # Break the stroke between segments by ending every segment with a
+                # NaN, which pyqtgraph skips when connect="finite".
+                x_coords = np.concatenate(
+                    [np.append(x, np.nan) for x, _ in stroke_pieces]
+                )
+                z_coords = np.concatenate(
+                    [np.append(z, np.nan) for _, z in stroke_pieces]
+                )
+                stroke_pen = self._pen(
+                    strand.styles.color.value,
+                    strand.styles.thickness.value * self.modifiers.stroke_mod,
+                )
+
+                # Create the actual plot data item for the strand's strokes.
+                plotted_stroke = pg.PlotDataItem(
+                    x_coords,
+                    z_coords,
+                    pen=stroke_pen,
+                    connect="finite",
+                    name=f"Strand#{strand_index} Strokes",
+                )
+                # Make it so that the stroke itself can be clicked.
+                plotted_stroke.setCurveClickable(True)
+                # When the stroke is clicked, emit the strand_clicked
+                # signal. This will lead to the creation of a
+                # StrandConfig dialog.
+                plotted_stroke.sigClicked.connect(
+                    lambda *args, f=strand: self.strand_clicked.emit(f)
+                )
+                # Store the stroke plotter object, which will be used later.
+                self.plot_data.plotted_strokes.append(plotted_stroke)
+
         for stroke in self.plot_data.plotted_strokes:
             self.addItem(stroke)
 
@@ -769,36 +948,44 @@ class SideViewPlotter(Plotter):
             self.removeItem(nick)
         self.plot_data.plotted_nicks.clear()
 
-        nick_brush = pg.mkBrush(color=settings.colors["nicks"])
-        for nick_index, nick in enumerate(self.strands.nicks):
+        nicks = tuple(self.strands.nicks)
+        if not nicks:
+            return
+
+        x_coords = np.empty(len(nicks), dtype=float)
+        z_coords = np.empty(len(nicks), dtype=float)
+        for nick_index, nick in enumerate(nicks):
             if nick.x_coord % 1 == 0:
-                x_coord = (
+                x_coords[nick_index] = (
                     nick.previous_item().domain.index + settings.domain_line_point_shift
                 )
             else:
-                x_coord = nick.x_coord
-
-            # Create the plot data item for the nick.
-            plotted_nick = pg.PlotDataItem(
-                (x_coord,),  # Just one point: the nick's x coordinate
-                (nick.z_coord,),  # Just one point: the nick's z coordinate
-                # The same styles for all nicks...
-                symbol="o",
-                symbolSize=8 * self.modifiers.nick_mod,
-                pxMode=True,  # means that symbol size doesn't change with zoom
-                symbolBrush=nick_brush,
-                symbolPen=None,  # No outline for the symbol
-                pen=None,  # No line connecting the points
-                name=f"Nick#{nick_index}",
-            )
-            # Store the nick plotter object, which will be used for actually
-            # plotting the nick later.
-            self.plot_data.plotted_nicks.append(plotted_nick)
-            # Create a mapping from the nick's coordinates to the nick itself,
-            # so that when it is clicked, we can find the nick object.
-            self.plot_data.points[(x_coord, nick.z_coord)] = nick
-            # Hook up the nick's onClick method to the _points_clicked method.
-            plotted_nick.sigPointsClicked.connect(self._points_clicked)
+                x_coords[nick_index] = nick.x_coord
+            z_coords[nick_index] = nick.z_coord
+
+        # Create one plot data item for all the nicks, since they all share the same
+        # styles.
+        plotted_nicks = pg.PlotDataItem(
+            x_coords,
+            z_coords,
+            # The same styles for all nicks...
+            symbol="o",
+            symbolSize=8 * self.modifiers.nick_mod,
+            pxMode=True,  # means that symbol size doesn't change with zoom
+            symbolBrush=self._brush(settings.colors["nicks"]),
+            symbolPen=None,  # No outline for the symbol
+            pen=None,  # No line connecting the points
+            skipFiniteCheck=True,
+            data=nicks,  # So that when one is clicked, we can find the nick
+            name="Nicks",
+        )
+        # Nicks are raised to the same level as the points of the strands.
+        plotted_nicks.setZValue(1)
+        # Store the nicks plotter object, which will be used for actually
+        # plotting the nicks later.
+        self.plot_data.plotted_nicks.append(plotted_nicks)
+        # Hook up the nicks' onClick method to the _points_clicked method.
+        plotted_nicks.sigPointsClicked.connect(self._points_clicked)
 
         for nick in self.plot_data.plotted_nicks:
             self.addItem(nick)
@@ -120,6 +120,13 @@ class TopViewPlotter(Plotter):
 
         self.getViewBox().setDefaultPadding(0.18)
 
+        # Replots are run by a zero-interval single-shot timer, so that refresh
+        # calls made while a replot is already pending are absorbed into it.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._replot)
+
         self._plot()
         self._prettify()
         self.auto_range()
@@ -147,17 +154,30 @@ class TopViewPlotter(Plotter):
             self.point_clicked.emit(tuple(point))
 
     def refresh(self):
-        """Refresh the plot."""
-        QTimer.singleShot(0, self._reset)
-        QTimer.singleShot(0, self._plot)
+        """
+        Refresh the plot.
+
+        Notes:
+            The replot happens on the next pass of the event loop. However many
+            times this is called before then, the plot is only replotted once.
+        """
+        self._refresh_timer.start()
         logger.info("Refreshed top view.")
 
+    def _replot(self):
+        """Clear the plot and plot it again."""
+        self._reset()
+        self._plot()
+
     def _reset(self, plot_data=None):
-        """Clear all plotted artifacts."""
+        """
+        Clear all plotted artifacts.
+
+        The plotted domains and stroke are not removed, since _plot() pushes new
+        data into the existing items instead of recreating them.
+        """
         if plot_data is None:
             plot_data = self.plot_data
-        self.removeItem(plot_data.plotted_domains)
-        self.removeItem(plot_data.plotted_stroke)
         for number in plot_data.plotted_numbers:
             self.removeItem(number)
         for button in plot_data.plotted_buttons:
@@ -215,38 +235,44 @@ class TopViewPlotter(Plotter):
         """
         Plot the domains.
 
-        This plots the domains and stores them in self.plot_data.
+        This plots the domains and stores them in self.plot_data. If the domains
+        have already been plotted, the existing plot item is updated in place.
 
         Args:
             u_coords: X coords of the domains.
             v_coords: Y coords of the domains.
         """
-        self.plot_data.plotted_domains = self.plot(
-            u_coords,
-            v_coords,
+        styles = dict(
             symbol="o",
             symbolSize=self.circle_radius,
             symbolBrush=pg.mkBrush(settings.colors["domains"]["fill"]),
             pxMode=False,
         )
+        if self.plot_data.plotted_domains is None:
+            self.plot_data.plotted_domains = self.plot(u_coords, v_coords, **styles)
+        else:
+            self.plot_data.plotted_domains.setData(u_coords, v_coords, **styles)
 
     def _plot_stroke(self, u_coords: List[float], v_coords: List[float]) -> None:
         """
         Plot the stroke connecting the domain circles.
 
-        This plots the stroke and stores it in self.plot_data.
+        This plots the stroke and stores it in self.plot_data. If the stroke has
+        already been plotted, the existing plot item is updated in place.
 
         Args:
             u_coords: X coords of the plotted_stroke.
             v_coords: Y coords of the plotted_stroke.
         """
-        self.plot_data.plotted_stroke = self.plot(
-            u_coords,
-            v_coords,
+        styles = dict(
             pen=pg.mkPen(color=settings.colors["domains"]["pen"], width=self.stroke),
             symbol=None,
             pxMode=False,
         )
+        if self.plot_data.plotted_stroke is None:
+            self.plot_data.plotted_stroke = self.plot(u_coords, v_coords, **styles)
+        else:
+            self.plot_data.plotted_stroke.setData(u_coords, v_coords, **styles)
 
     def _plot_numbers(self, u_coords: List[float], v_coords: List[float]) -> None:
         """
@@ -89,10 +89,10 @@ def chaikins_corner_cutting(
         The rounded coords.
 
     Notes:
-        Coords will be mutated
+        The coords are not mutated; a new (N, 2) float array is returned.
     """
     # https://stackoverflow.com/a/47255374
-    coords = np.array(coords) if not isinstance(coords, np.ndarray) else coords
+    coords = np.asarray(coords, dtype=float)
 
     for i in range(refinements):
         L = coords.repeat(2, axis=0)
@@ -35,3 +35,26 @@ def fetch_icon(name: str, folder="generic_icons") -> QIcon:
     if platform.system() == "Linux":
         icon_path = convert_svg_to_png(icon_path)
     return QIcon(icon_path)
+
+
+def preload_icons(folder="generic_icons") -> None:
+    """
+    Fetch every icon in an icon folder, so that fetch_icon's cache is warm.
+
+    Fetching an icon for the first time means parsing its SVG (and on Linux
+    converting it to a PNG), which otherwise happens one icon at a time as widgets
+    are created.
+
+    Args:
+        folder: The folder within the icons directory to preload.
+    """
+    icons_path = Runner.root() / f"./ui/resources/icons/{folder}"
+    for icon_path in icons_path.glob("*.svg"):
+        # fetch_icon's cache is keyed on the arguments exactly as passed, and the
+        # widgets fetch generic icons by name alone, so the default folder must not
+        # be passed explicitly or the cache entries they read are never warmed.
+        if folder == "generic_icons":
+            fetch_icon(icon_path.stem)
+        else:
+            fetch_icon(icon_path.stem, folder)
+    logger.debug("Preloaded icons from %s.", icons_path)
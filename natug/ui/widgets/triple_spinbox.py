@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QHBoxLayout, QSpinBox, QWidget
 
 class TripleSpinbox(QWidget):
     editingFinished = pyqtSignal()
+    valuesChanged = pyqtSignal()
 
     def __init__(self, values: Tuple[int, int, int] = None):
         super().__init__()
@@ -44,6 +45,9 @@ class TripleSpinbox(QWidget):
         self.box1.editingFinished.connect(self.editingFinished.emit)
         self.box2.editingFinished.connect(self.editingFinished.emit)
         self.box3.editingFinished.connect(self.editingFinished.emit)
+        self.box1.valueChanged.connect(self.valuesChanged.emit)
+        self.box2.valueChanged.connect(self.valuesChanged.emit)
+        self.box3.valueChanged.connect(self.valuesChanged.emit)
 
     def _prettify(self):
         """Set the styles for the widget."""